@@ -0,0 +1,258 @@
+# Input generators for sort/select benchmarks (merge_sort, counting_sort, radix_sort,
+# quickselect_random, quickselect_mom, ...)
+# Every distribution streams array('q') chunks, so inputs up to 10^8 values never
+# need more than one chunk in memory; write_input() spills them to a binary file
+# and load_input() maps that file back, so benchmarks replay identical data cheaply.
+# Adversarial inputs are built by running the target algorithm against McIlroy's
+# lazy-comparison adversary ("A Killer Adversary for Quicksort", 1999).
+
+import mmap
+import os
+import random
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'w3'))
+from quickselect import dnf_partition, quickselect_random  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:  # random distributions fall back to the random module
+    np = None
+
+CHUNK = 1 << 20  # values per yielded chunk (8 MB of int64)
+
+
+def _ranges(n, chunk):
+    for lo in range(0, n, chunk):
+        yield lo, min(lo + chunk, n)
+
+
+# ------------------ DISTRIBUTIONS ------------------
+# Each function yields array('q') chunks whose concatenation is the input.
+
+def sorted_input(n, chunk=CHUNK):
+    for lo, hi in _ranges(n, chunk):
+        yield array('q', range(lo, hi))
+
+
+def reversed_input(n, chunk=CHUNK):
+    for lo, hi in _ranges(n, chunk):
+        yield array('q', range(n - 1 - lo, n - 1 - hi, -1))
+
+
+def organ_pipe(n, chunk=CHUNK):
+    # 0, 1, ..., peak, ..., 1, 0: ascending then descending
+    half = (n + 1) // 2
+    for lo, hi in _ranges(n, chunk):
+        yield array('q', (i if i < half else n - 1 - i for i in range(lo, hi)))
+
+
+def sawtooth(n, period=1000, chunk=CHUNK):
+    # Repeated ascending runs of length period
+    for lo, hi in _ranges(n, chunk):
+        yield array('q', (i % period for i in range(lo, hi)))
+
+
+def uniform(n, max_val=2**31, seed=0, chunk=CHUNK):
+    rng = np.random.default_rng(seed) if np is not None else random.Random(seed)
+    for lo, hi in _ranges(n, chunk):
+        if np is not None:
+            yield array('q', rng.integers(0, max_val, hi - lo).tobytes())
+        else:
+            yield array('q', (rng.randrange(max_val) for _ in range(hi - lo)))
+
+
+def few_unique(n, unique=10, seed=0, chunk=CHUNK):
+    # Only `unique` distinct values: stresses duplicate handling (DNF's equal region)
+    yield from uniform(n, unique, seed, chunk)
+
+
+def zipf(n, s=1.2, universe=10**6, seed=0, chunk=CHUNK):
+    # Value r (1-based rank) with probability proportional to 1 / r^s, s > 1 with NumPy
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        for lo, hi in _ranges(n, chunk):
+            yield array('q', np.minimum(rng.zipf(s, hi - lo), universe).astype(np.int64).tobytes())
+        return
+    rng = random.Random(seed)
+    cum, total = [], 0.0
+    for r in range(1, universe + 1):
+        total += r ** -s
+        cum.append(total)
+    values = range(1, universe + 1)
+    for lo, hi in _ranges(n, chunk):
+        yield array('q', rng.choices(values, cum_weights=cum, k=hi - lo))
+
+
+# ------------------ ADVERSARIAL INPUTS ------------------
+
+def adversary_input(n, select, k=None):
+    """
+    Input that drives `select(A, k)` towards its worst case (McIlroy's adversary).
+
+    The algorithm is run on n placeholder items whose values are unknown ("gas").
+    When two gas items are compared, one is frozen to the next smallest value,
+    keeping the other (the likely pivot) as gas, so pivots keep landing at the
+    extreme of their range. The frozen values, read in the items' original
+    positions, form an input on which the same deterministic algorithm repeats
+    that behaviour. Generation costs as much as the attacked run, i.e. O(n^2).
+    """
+    gas = n
+    val = [gas] * n
+    state = {'solid': 0, 'candidate': None}
+
+    def freeze(i):
+        val[i] = state['solid']
+        state['solid'] += 1
+
+    class Item:
+        __slots__ = ('i',)
+
+        def __init__(self, i):
+            self.i = i
+
+        def _cmp(self, other):
+            x, y = self.i, other.i
+            if val[x] == gas and val[y] == gas:
+                freeze(x if x == state['candidate'] else y)
+            if val[x] == gas:
+                state['candidate'] = x
+            elif val[y] == gas:
+                state['candidate'] = y
+            return val[x] - val[y]
+
+        def __lt__(self, other):
+            return self._cmp(other) < 0
+
+        def __gt__(self, other):
+            return self._cmp(other) > 0
+
+        def __le__(self, other):
+            return self._cmp(other) <= 0
+
+        def __ge__(self, other):
+            return self._cmp(other) >= 0
+
+        def __eq__(self, other):
+            return self is other or self._cmp(other) == 0
+
+        __hash__ = object.__hash__
+
+    items = [Item(i) for i in range(n)]
+    if n:
+        select(items, n // 2 if k is None else k)
+    for i in range(n):  # values never compared against a pivot
+        if val[i] == gas:
+            freeze(i)
+    return val
+
+
+def median_of_3_select(A, k):
+    # Reference quickselect with a median-of-3 pivot (first, middle, last) and DNF partition
+    lo, hi = 0, len(A) - 1
+    while lo < hi:
+        a, b, c = A[lo], A[(lo + hi) // 2], A[hi]
+        pivot = sorted([a, b, c])[1]
+        lt, gt = dnf_partition(A, lo, hi, pivot)
+        if k < lt:
+            hi = lt - 1
+        elif k > gt:
+            lo = gt + 1
+        else:
+            return A[k]
+    return A[lo]
+
+
+def median_of_3_killer(n, k=None, chunk=CHUNK):
+    """Median-of-3 killer: median_of_3_select makes O(n^2) comparisons on it."""
+    values = adversary_input(n, median_of_3_select, k)
+    for lo, hi in _ranges(n, chunk):
+        yield array('q', values[lo:hi])
+
+
+def dnf_swap_killer(n, k=None, seed=0, chunk=CHUNK):
+    """
+    Input on which quickselect_random, with random seeded to `seed`, picks the
+    smallest remaining value as pivot every round, so dnf_partition performs
+    about n^2/4 swaps in total. Re-seed random with the same seed when replaying.
+    """
+    def select(A, target):
+        random.seed(seed)
+        return quickselect_random(A, target)
+    values = adversary_input(n, select, k)
+    for lo, hi in _ranges(n, chunk):
+        yield array('q', values[lo:hi])
+
+
+# ------------------ FILE OUTPUT ------------------
+
+def write_input(path, chunks):
+    # Streams the chunks to a binary int64 file; returns the number of values written
+    count = 0
+    with open(path, 'wb') as f:
+        for c in chunks:
+            c.tofile(f)
+            count += len(c)
+    return count
+
+
+def load_input(path):
+    """Read-only int64 view of a file from write_input (np.memmap, else memoryview)."""
+    if np is not None:
+        if os.path.getsize(path) == 0:
+            return np.zeros(0, dtype=np.int64)
+        return np.memmap(path, dtype=np.int64, mode='r')
+    with open(path, 'rb') as f:
+        if os.path.getsize(path) == 0:
+            return memoryview(array('q'))
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)).cast('q')
+
+
+def materialise(chunks):
+    # Whole input as one list, for algorithms that need a mutable list
+    out = []
+    for c in chunks:
+        out.extend(c)
+    return out
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    n = 16
+    for name, gen in (("sorted", sorted_input(n)), ("reversed", reversed_input(n)),
+                      ("organ pipe", organ_pipe(n)), ("sawtooth", sawtooth(n, 5)),
+                      ("few unique", few_unique(n, 3)), ("zipf", zipf(n, 1.5, 100)),
+                      ("median-of-3 killer", median_of_3_killer(n)),
+                      ("dnf swap killer", dnf_swap_killer(n))):
+        print(f"{name:<20} {materialise(gen)}")
+
+    # Comparisons made by median-of-3 select on random vs killer input
+    class Counted:
+        comparisons = 0
+        def __init__(self, v):
+            self.v = v
+        def __lt__(self, other):
+            Counted.comparisons += 1
+            return self.v < other.v
+        def __gt__(self, other):
+            Counted.comparisons += 1
+            return self.v > other.v
+
+    n = 2000
+    for name, gen in (("uniform", uniform(n, seed=1)), ("median-of-3 killer", median_of_3_killer(n))):
+        Counted.comparisons = 0
+        median_of_3_select([Counted(v) for v in materialise(gen)], n // 2)
+        print(f"median_of_3_select on {name:<20} n={n}: {Counted.comparisons} comparisons")
+
+    # Spill 10^6 Zipf values to disk and map them back
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'zipf.bin')
+        start = time.perf_counter()
+        written = write_input(path, zipf(10**6, seed=7))
+        data = load_input(path)
+        print(f"zipf: wrote {written} values in {time.perf_counter() - start:.2f}s, "
+              f"mapped back {len(data)} values, first 8 = {data[:8].tolist()}")
+        del data
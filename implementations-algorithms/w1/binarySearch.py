@@ -1,3 +1,9 @@
+try:
+    import numpy as np
+except ImportError:  # batched and Eytzinger searches fall back to Python loops
+    np = None
+
+
 def binary_search(array, key):
     lo = 0
     hi = len(array)
@@ -13,6 +19,144 @@ def binary_search(array, key):
         return None
 
 
+def lower_bound(array, key, lo=0, hi=None):
+    # First index i in [lo, hi) with array[i] >= key (hi if none): O(log n)
+    if hi is None:
+        hi = len(array)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if array[mid] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def upper_bound(array, key, lo=0, hi=None):
+    # First index i in [lo, hi) with array[i] > key (hi if none): O(log n)
+    if hi is None:
+        hi = len(array)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key < array[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def equal_range(array, key):
+    # (first, last + 1) of the block equal to key; empty block at the insertion point
+    lo = lower_bound(array, key)
+    return lo, upper_bound(array, key, lo)
+
+
+def batch_lower_bound(array, keys):
+    """
+    lower_bound for many keys at once; returns insertion points in query order.
+
+    NumPy inputs use np.searchsorted. Otherwise the queries are sorted and
+    answered in one left-to-right pass: a linear sweep when there are enough
+    queries to touch most of the array, else binary searches that each start
+    at the previous answer.
+    Time Complexity: O(q log q + min(n + q, q log n))
+    """
+    if np is not None and isinstance(array, np.ndarray):
+        return np.searchsorted(array, keys, side='left')
+    n, q = len(array), len(keys)
+    result = [0] * q
+    order = sorted(range(q), key=keys.__getitem__)  # O(q log q)
+    sweep = q * max(n.bit_length(), 1) >= n
+    i = 0
+    for t in order:
+        key = keys[t]
+        if sweep:
+            while i < n and array[i] < key:  # O(n + q) overall
+                i += 1
+        else:
+            i = lower_bound(array, key, i)
+        result[t] = i
+    return result
+
+
+def batch_binary_search(array, keys):
+    # binary_search for many keys: index of the last occurrence, or None
+    result = []
+    for key, i in zip(keys, batch_lower_bound(array, keys)):
+        j = upper_bound(array, key, int(i))
+        result.append(j - 1 if j > i else None)
+    return result
+
+
+class EytzingerArray:
+    """
+    A sorted array stored in BFS (Eytzinger) order: node k has children 2k, 2k+1.
+
+    The first levels of the implicit tree, visited by every search, sit
+    together at the front of the buffer, so large static tables take far
+    fewer cache misses than with classic binary search. The descent
+    k = 2k + (b[k] < key) has no data-dependent branch.
+    Build: O(n), Search: O(log n), Space: O(n)
+    """
+
+    def __init__(self, sorted_array):
+        self.n = n = len(sorted_array)
+        self.b = [None] * (n + 1)  # b[0] unused
+        self.rank = [n] * (n + 1)  # rank[k] = index of b[k] in sorted_array; rank[0] = n
+        i = 0
+        # In-order walk of the implicit tree assigns sorted values to BFS slots
+        stack, k = [], 1
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            self.b[k] = sorted_array[i]
+            self.rank[k] = i
+            i += 1
+            k = 2 * k + 1
+        if np is not None and isinstance(sorted_array, np.ndarray):
+            self.b = np.array([sorted_array[0] if n else 0] + self.b[1:], dtype=sorted_array.dtype)
+            self.rank = np.array(self.rank)
+
+    def _descend(self, key, strict):
+        # Branch-free descent; strict=True finds the lower bound, False the upper bound
+        k = 1
+        b, n = self.b, self.n
+        if strict:
+            while k <= n:
+                k = 2 * k + (b[k] < key)
+        else:
+            while k <= n:
+                k = 2 * k + (not key < b[k])
+        k >>= (~k & (k + 1)).bit_length()  # undo the right turns taken after the answer
+        return self.rank[k]
+
+    def lower_bound(self, key):
+        return self._descend(key, True)
+
+    def upper_bound(self, key):
+        return self._descend(key, False)
+
+    def search(self, key):
+        # Same contract as binary_search: index of the last occurrence, or None
+        i, j = self.lower_bound(key), self.upper_bound(key)
+        return j - 1 if j > i else None
+
+    def batch_lower_bound(self, keys):
+        """Vectorized descent for a whole batch of keys (NumPy), else one by one."""
+        if np is None or not isinstance(self.b, np.ndarray):
+            return [self.lower_bound(key) for key in keys]
+        keys = np.asarray(keys)
+        k = np.ones(len(keys), dtype=np.int64)
+        for _ in range(self.n.bit_length()):
+            live = k <= self.n
+            k = np.where(live, 2 * k + (self.b[np.where(live, k, 0)] < keys), k)
+        low_zero = ~k & (k + 1)  # lowest zero bit of k, as a power of two
+        k >>= np.log2(low_zero).astype(np.int64) + 1
+        return self.rank[k]
+
+
 if __name__ == "__main__":
     test_cases = [
         ([1, 3, 5, 7, 9, 11, 13], 7),      # key in middle
@@ -27,4 +171,14 @@ if __name__ == "__main__":
     ]
     for arr, key in test_cases:
         idx = binary_search(arr, key)
-        print(f"Array: {arr}, Key: {key} => Index: {idx}")
+        print(f"Array: {arr}, Key: {key} => Index: {idx}, "
+              f"equal_range: {equal_range(arr, key)}, "
+              f"Eytzinger: {EytzingerArray(arr).search(key)}")
+
+    # Batched lookups answered in one pass over the sorted queries
+    table = [1, 3, 5, 7, 9, 11, 13]
+    queries = [13, 0, 7, 4, 7, 20]
+    print(f"\nQueries: {queries}")
+    print(f"batch_lower_bound:   {batch_lower_bound(table, queries)}")
+    print(f"batch_binary_search: {batch_binary_search(table, queries)}")
+    print(f"Eytzinger layout:    {EytzingerArray(table).b[1:]}")
@@ -1,3 +1,7 @@
+from array import array
+from collections import deque
+
+
 def merge_and_count_split_inv(left, right):
     result = []
     i = j = 0
@@ -28,6 +32,86 @@ def sort_and_count_inv(array, lo, hi):
         return merged, inv_left + inv_right + inv_split
 
 
+# ------------------ FENWICK TREE (BIT) ENGINE ------------------
+# Counts pairs i < j with array[i] > array[j] by scanning left to right and
+# asking a Binary Indexed Tree how many earlier values exceed the current one.
+# Values are coordinate-compressed to ranks 1..u first, so the tree is a flat
+# array('q') of u + 1 counters regardless of the value range.
+# Time Complexity: O(n log n), Auxiliary Space: O(u)
+
+class FenwickTree:
+    def __init__(self, size):
+        self.tree = array('q', [0]) * (size + 1)  # 1-based
+
+    def add(self, i, delta):
+        # O(log n)
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        # Sum of counts at ranks 1..i: O(log n)
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+
+def compress(values):
+    # Maps each distinct value to its 1-based rank: O(u log u)
+    return {v: r for r, v in enumerate(sorted(set(values)), start=1)}
+
+
+def count_inversions_bit(array_in):
+    """One-shot inversion count with no intermediate lists; matches sort_and_count_inv."""
+    rank = compress(array_in)
+    bit = FenwickTree(len(rank))
+    inversions = 0
+    for seen, x in enumerate(array_in):  # O(n log n)
+        r = rank[x]
+        inversions += seen - bit.prefix(r)  # earlier elements strictly greater than x
+        bit.add(r, 1)
+    return inversions
+
+
+class InversionWindow:
+    """
+    Inversion count of a sliding window over a stream, O(log u) per event.
+
+    :param universe: every value the stream may contain (for compression)
+    :param maxlen: optional window length; push() evicts the oldest when full
+    """
+
+    def __init__(self, universe, maxlen=None):
+        self.rank = compress(universe)
+        self.bit = FenwickTree(len(self.rank))
+        self.window = deque()
+        self.maxlen = maxlen
+        self.inversions = 0
+
+    def push(self, x):
+        # Newest element: inverted with every window element greater than it
+        if self.maxlen is not None and len(self.window) == self.maxlen:
+            self.pop()
+        r = self.rank[x]
+        self.inversions += len(self.window) - self.bit.prefix(r)
+        self.bit.add(r, 1)
+        self.window.append(x)
+        return self.inversions
+
+    def pop(self):
+        # Oldest element: inverted with every later element smaller than it
+        x = self.window.popleft()
+        r = self.rank[x]
+        self.bit.add(r, -1)
+        self.inversions -= self.bit.prefix(r - 1)
+        return x
+
+    def __len__(self):
+        return len(self.window)
+
+
 if __name__ == "__main__":
     test_cases = [
         [1, 2, 3, 4, 5],            # sorted, 0 inversions
@@ -43,5 +127,13 @@ if __name__ == "__main__":
             sorted_arr, inv_count = sort_and_count_inv(arr, 0, len(arr)-1)
         else:
             sorted_arr, inv_count = [], 0
-        print(f"Array: {arr}\nSorted: {sorted_arr}\nInversions: {inv_count}\n")
+        print(f"Array: {arr}\nSorted: {sorted_arr}\nInversions: {inv_count}")
+        print(f"BIT inversions: {count_inversions_bit(arr)}\n")
+
+    # Sliding window of 4 over a ranking stream
+    stream = [3, 1, 4, 1, 5, 9, 2, 6]
+    window = InversionWindow(stream, maxlen=4)
+    for x in stream:
+        window.push(x)
+        print(f"window {list(window.window)}: {window.inversions} inversions")
 
@@ -0,0 +1,148 @@
+# Binary search over sorted fixed-width record files that do not fit in RAM
+# The file is memory-mapped and exposed as a read-only sequence of keys, so the
+# existing binary_search / lower_bound / upper_bound run on it unchanged.
+# A sparse in-memory index of every k-th key narrows each search to one block
+# of k records (by default INDEX_PAGES pages), so a lookup touches at most
+# log2(INDEX_PAGES) + 1 pages instead of O(log n).
+# Building the index reads one record per block: n/k page reads, 1/INDEX_PAGES of the
+# file (a 64 GB file needs 256K page reads, ~1 GB of I/O, for a 2 MB index).
+# Time Complexity: O(log(n/k) + log k) per lookup, O(n/k) to build the index
+# Auxiliary Space: O(n/k), 8 bytes per entry (array('q') / 'Q' / 'd' for numeric keys)
+
+import mmap
+import os
+import random
+import re
+import struct
+import tempfile
+from array import array
+
+from binarySearch import binary_search, lower_bound, upper_bound
+
+INDEX_PAGES = 64  # pages of records per sparse index entry (256 KB with 4 KB pages)
+
+
+def _key_typecode(fmt, key_field):
+    # array typecode that holds the key field of struct format fmt, or None
+    fields = []
+    for count, code in re.findall(r'(\d*)([a-zA-Z?])', fmt):
+        if code in 'sp':
+            fields.append(code)  # one bytes field whatever the count
+        elif code != 'x':
+            fields.extend(code * int(count or 1))
+    code = fields[key_field]
+    if code in 'bhilqn?':
+        return 'q'
+    if code in 'BHILQN':
+        return 'Q'
+    if code in 'efd':
+        return 'd'
+    return None  # bytes keys stay in a list
+
+
+class SortedRecordFile:
+    """
+    Read-only view of a file of packed records sorted by one field.
+
+    :param source: path to the file, or any buffer (np.memmap, mmap, bytes)
+    :param fmt: struct format of one record, e.g. '<qQ' for 16-byte key+offset
+    :param key_field: index of the sort key within the unpacked record
+    :param index_every: keep every k-th key in memory
+                        (default: one per INDEX_PAGES pages of records)
+    """
+
+    def __init__(self, source, fmt='<qQ', key_field=0, index_every=None):
+        self.record_struct = struct.Struct(fmt)
+        self.key_field = key_field
+        self._file = self._map = None
+        if isinstance(source, (str, os.PathLike)):
+            self._file = open(source, 'rb')
+            if os.fstat(self._file.fileno()).st_size:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.buf = memoryview(self._map)
+            else:
+                self.buf = memoryview(b'')
+        else:
+            self.buf = memoryview(source).cast('B')
+        self.n = len(self.buf) // self.record_struct.size
+        self.index_every = index_every or max(1, INDEX_PAGES * mmap.PAGESIZE // self.record_struct.size)
+        sampled = (self[i] for i in range(0, self.n, self.index_every))  # O(n/k) page reads
+        typecode = _key_typecode(fmt, key_field)
+        self.sparse = array(typecode, sampled) if typecode else list(sampled)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        # Key of record i, decoded straight from the mapping: O(1)
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        return self.record_struct.unpack_from(self.buf, i * self.record_struct.size)[self.key_field]
+
+    def record(self, i):
+        return self.record_struct.unpack_from(self.buf, i * self.record_struct.size)
+
+    def _block(self, j):
+        # Records strictly after sparse entry j-1, up to and including sparse entry j
+        k = self.index_every
+        return (j - 1) * k + 1 if j else 0, min(j * k, self.n)
+
+    def lower_bound(self, key):
+        lo, hi = self._block(lower_bound(self.sparse, key))  # in memory, no page faults
+        return lower_bound(self, key, lo, hi)  # within one block of k records
+
+    def upper_bound(self, key):
+        lo, hi = self._block(upper_bound(self.sparse, key))
+        return upper_bound(self, key, lo, hi)
+
+    def search(self, key):
+        # Same contract as binary_search: index of the last record with this key, or None
+        i = self.upper_bound(key)
+        return i - 1 if i > 0 and self[i - 1] == key else None
+
+    def batch_search(self, keys):
+        """
+        search() for many keys; returns indices in query order.
+
+        Queries are answered in ascending key order, so consecutive lookups
+        walk forward through the file and reuse pages already in the cache.
+        """
+        result = [None] * len(keys)
+        for t in sorted(range(len(keys)), key=keys.__getitem__):
+            result[t] = self.search(keys[t])
+        return result
+
+    def close(self):
+        self.buf.release()
+        if self._map is not None:
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    rng = random.Random(2004)
+    keys = sorted(rng.sample(range(10**9), 50_000)) + [10**9] * 3  # duplicates at the end
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'index.bin')
+        with open(path, 'wb') as f:
+            for offset, key in enumerate(keys):
+                f.write(struct.pack('<qQ', key, offset * 4096))
+
+        with SortedRecordFile(path, fmt='<qQ') as table:
+            print(f"{len(table)} records, sparse index of {len(table.sparse)} keys")
+            for key in (keys[0], keys[12345], 10**9, -1, keys[100] + 1):
+                i = table.search(key)
+                # The mapped file is a plain sequence, so binary_search itself works too
+                status = "✓" if i == binary_search(table, key) else "✗"
+                print(f"  key {key}: index {i}, record {table.record(i) if i is not None else None} {status}")
+
+            queries = [rng.choice(keys) for _ in range(1000)] + [rng.randrange(10**9) for _ in range(1000)]
+            expected = [binary_search(keys, q) for q in queries]
+            print("batch_search matches binary_search:", table.batch_search(queries) == expected)
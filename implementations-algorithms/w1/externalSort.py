@@ -0,0 +1,250 @@
+# External (out-of-core) k-way merge sort for binary files of fixed-width records
+# Phase 1: split the input into memory-budgeted runs, sort each with merge_sort, spill to temp files
+# Phase 2: stream fan_in runs at a time through a loser tree until one run remains
+# Time Complexity: O(N log N) comparisons, O(N/B * (1 + log_F(R))) block I/Os
+#   (N records, B records per block, R initial runs, F = fan_in)
+# Auxiliary Space: O(memory_budget) in RAM, O(N) on disk
+
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import tracemalloc
+
+from mergeSort import merge_sort
+
+LIST_SLOT = 8  # bytes per list entry (one pointer)
+
+
+class LoserTree:
+    """
+    Tournament tree over k sorted sources; each pop costs O(log k) comparisons.
+
+    tree[0] holds the index of the current overall winner and tree[1..k-1]
+    hold the loser of the match played at each internal node, so replaying
+    after a pop only walks the path from the winner's leaf to the root.
+    Ties are broken by source index, so merging runs in input order is stable.
+    """
+
+    _EXHAUSTED = object()
+
+    def __init__(self, sources):
+        self.sources = [iter(s) for s in sources]
+        self.k = len(self.sources)
+        self.heads = [next(s, self._EXHAUSTED) for s in self.sources]
+        self.tree = [0] * max(self.k, 1)
+
+        # Build bottom-up: winner[node] is the winner of the subtree at node
+        winner = [0] * (2 * self.k)
+        for i in range(self.k):
+            winner[self.k + i] = i
+        for node in range(self.k - 1, 0, -1):
+            a, b = winner[2 * node], winner[2 * node + 1]
+            if self._beats(a, b):
+                winner[node], self.tree[node] = a, b
+            else:
+                winner[node], self.tree[node] = b, a
+        if self.k:
+            self.tree[0] = winner[1] if self.k > 1 else 0
+
+    def _beats(self, a, b):
+        # True if source a's head should be output before source b's head
+        ha, hb = self.heads[a], self.heads[b]
+        if hb is self._EXHAUSTED:
+            return ha is not self._EXHAUSTED or a < b
+        if ha is self._EXHAUSTED:
+            return False
+        if ha < hb:
+            return True
+        if hb < ha:
+            return False
+        return a < b
+
+    def __iter__(self):
+        if not self.k:
+            return
+        while self.heads[self.tree[0]] is not self._EXHAUSTED:
+            w = self.tree[0]
+            yield self.heads[w]
+            self.heads[w] = next(self.sources[w], self._EXHAUSTED)
+            # Replay matches on the path from leaf w to the root: O(log k)
+            node = (w + self.k) // 2
+            while node >= 1:
+                if self._beats(self.tree[node], w):
+                    self.tree[node], w = w, self.tree[node]
+                node //= 2
+            self.tree[0] = w
+
+
+def read_run(path, record, block_records):
+    """
+    Yields records from a run file, block_records at a time.
+
+    The file is memory-mapped when possible so blocks are decoded straight
+    from the page cache; otherwise (empty file, no mmap) it is read in blocks.
+    """
+    block_bytes = block_records * record.size
+    with open(path, 'rb') as f:
+        try:
+            view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):  # empty file or mmap unsupported
+            view = None
+        if view is not None:
+            with view:
+                for offset in range(0, len(view), block_bytes):
+                    yield from record.iter_unpack(view[offset:offset + block_bytes])
+            return
+        while True:
+            block = f.read(block_bytes)
+            if not block:
+                return
+            yield from record.iter_unpack(block)
+
+
+def write_run(path, records, record, block_records):
+    # Writes records through a block-sized buffer: O(len(records))
+    with open(path, 'wb', buffering=block_records * record.size) as f:
+        for r in records:
+            f.write(record.pack(*r))
+
+
+def record_cost(record):
+    """
+    Bytes one decoded record costs while its run is sorted: the tuple, one
+    object per field (ints sized at 64 bits), and a slot in each of the three
+    lists alive during merge_sort (the chunk, its copy and the aux buffer).
+    """
+    fields = record.unpack(bytes(record.size))
+    objects = sum(sys.getsizeof(f) if isinstance(f, bytes) else sys.getsizeof(-2**63)
+                  for f in fields)
+    return sys.getsizeof(fields) + objects + 3 * LIST_SLOT
+
+
+def _remove(paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def make_runs(input_path, record, run_records, block_records, tmp_dir):
+    # Phase 1: sort each memory-sized chunk and spill it; returns the run paths.
+    # On error, the runs written so far are removed.
+    runs = []
+    try:
+        for chunk in _chunks(read_run(input_path, record, block_records), run_records):
+            chunk = merge_sort(chunk, 0, len(chunk) - 1)  # O(m log m) for m = run_records
+            fd, path = tempfile.mkstemp(suffix='.run', dir=tmp_dir)
+            os.close(fd)
+            runs.append(path)
+            write_run(path, chunk, record, block_records)
+            del chunk  # free this run before the next one is read in
+    except BaseException:
+        _remove(runs)
+        raise
+    return runs
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def external_sort(input_path, output_path, fmt='<q', memory_budget=64 * 2**20,
+                  fan_in=16, tmp_dir=None):
+    """
+    Sorts a binary file of fixed-width records into output_path.
+
+    :param input_path: file of packed records (struct format fmt)
+    :param output_path: destination, may equal input_path
+    :param fmt: struct format of one record; records compare as tuples, so put
+                the sort key in the first field (e.g. '<qQ' for key+offset)
+    :param memory_budget: bytes of RAM for records: runs are sized by the decoded
+                          cost of a record (record_cost), not its packed size;
+                          during merging it is split between fan_in input buffers
+    :param fan_in: number of runs merged per pass (>= 2)
+    :param tmp_dir: directory for run files (default: next to output_path)
+    :return: dict with 'records', 'runs' and 'merge_passes'
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    record = struct.Struct(fmt)
+    block_records = max(1, memory_budget // record.size // (fan_in + 1))  # fan_in readers + one writer
+    # Phase 1 also holds one read block and one write buffer next to the run
+    run_records = max(1, (memory_budget - 2 * block_records * record.size) // record_cost(record))
+    if tmp_dir is None:
+        tmp_dir = os.path.dirname(os.path.abspath(output_path))
+
+    runs = make_runs(input_path, record, run_records, block_records, tmp_dir)
+    stats = {'records': os.path.getsize(input_path) // record.size,
+             'runs': len(runs), 'merge_passes': 0}
+    if not runs:
+        open(output_path, 'wb').close()
+        return stats
+
+    # Phase 2: merge groups of fan_in runs until a single run remains
+    live = set(runs)  # run files on disk, removed if anything fails
+    try:
+        while len(runs) > 1:
+            next_runs = []
+            for g in range(0, len(runs), fan_in):
+                group = runs[g:g + fan_in]
+                fd, path = tempfile.mkstemp(suffix='.run', dir=tmp_dir)
+                os.close(fd)
+                live.add(path)
+                sources = [read_run(p, record, block_records) for p in group]
+                write_run(path, LoserTree(sources), record, block_records)
+                _remove(group)
+                live.difference_update(group)
+                next_runs.append(path)
+            runs = next_runs
+            stats['merge_passes'] += 1
+
+        os.replace(runs[0], output_path)
+        live.discard(runs[0])
+    finally:
+        _remove(live)
+    return stats
+
+
+if __name__ == "__main__":
+    # k-way merge of in-memory sorted lists
+    print("LoserTree:", list(LoserTree([[1, 4, 9], [2, 3, 10], [], [0, 4]])))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rng = random.Random(2004)
+
+        # 100k int64 keys with a 1MB budget (~108 bytes per decoded record): 18 runs,
+        # three merge passes at fan-in 4; tracemalloc shows the peak stays near the budget
+        data = [rng.randint(-2**63, 2**63 - 1) for _ in range(100_000)]
+        src = os.path.join(tmp, 'ints.bin')
+        with open(src, 'wb') as f:
+            f.write(struct.pack(f'<{len(data)}q', *data))
+        dst = os.path.join(tmp, 'ints.sorted')
+        tracemalloc.start()
+        stats = external_sort(src, dst, fmt='<q', memory_budget=2**20, fan_in=4)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        with open(dst, 'rb') as f:
+            result = [r[0] for r in struct.iter_unpack('<q', f.read())]
+        print(f"int64 file: {stats}, peak {peak / 2**20:.2f} MB, sorted OK: {result == sorted(data)}")
+
+        # 16-byte key+offset records
+        recs = [(rng.randint(0, 1000), i) for i in range(20_000)]
+        src = os.path.join(tmp, 'recs.bin')
+        with open(src, 'wb') as f:
+            for r in recs:
+                f.write(struct.pack('<qQ', *r))
+        stats = external_sort(src, src, fmt='<qQ', memory_budget=256 * 1024, fan_in=8)
+        with open(src, 'rb') as f:
+            result = list(struct.iter_unpack('<qQ', f.read()))
+        print(f"key+offset file: {stats}, sorted OK: {result == sorted(recs)}")
@@ -0,0 +1,107 @@
+# Batched Kendall-tau distance between many rankings and one reference ranking
+# Kendall-tau distance = number of item pairs the two rankings order differently
+#                      = inversions of the ranking after relabelling each item by
+#                        its position in the reference
+# All rows are counted together: one Binary Indexed Tree per row, stored as a
+# single (m, n + 1) matrix, updated column by column with vectorized operations.
+# Time Complexity: O(m * n log n) work in O(n log n) NumPy operations of length m
+# Auxiliary Space: O(m * n)
+
+import random
+from multiprocessing import Pool
+
+from countInversions import count_inversions_bit, sort_and_count_inv
+
+try:
+    import numpy as np
+except ImportError:  # falls back to one count_inversions_bit call per row
+    np = None
+
+
+def relabel(rankings, reference):
+    """
+    Replaces every item by its position in reference, row by row.
+
+    Integer labels in 0..n-1 use a vectorized lookup table; other labels go
+    through a dict. Each row must be a permutation of reference.
+    """
+    rankings = np.asarray(rankings)
+    reference = np.asarray(reference)
+    n = len(reference)
+    if n and rankings.dtype.kind in 'iu' and reference.dtype.kind in 'iu' \
+            and reference.min() >= 0 and reference.max() < n:
+        position = np.empty(n, dtype=np.int64)
+        position[reference] = np.arange(n)
+        return position[rankings]
+    position = {item: i for i, item in enumerate(reference.tolist())}
+    return np.array([[position[x] for x in row] for row in rankings.tolist()], dtype=np.int64)
+
+
+def batch_inversions(relabelled):
+    """Inversion count of every row of an (m, n) array of values in 0..n-1."""
+    m, n = relabelled.shape
+    tree = np.zeros((m, n + 1), dtype=np.int64)  # tree[:, 0] stays 0
+    rows = np.arange(m)
+    inversions = np.zeros(m, dtype=np.int64)
+    for j in range(n):  # O(n) columns, each O(log n) vector ops
+        r = relabelled[:, j] + 1
+        # prefix(r): elements seen so far that are <= current
+        idx = r.copy()
+        seen_le = np.zeros(m, dtype=np.int64)
+        while idx.any():
+            seen_le += tree[rows, idx]
+            idx -= idx & -idx
+        inversions += j - seen_le
+        # add(r, 1)
+        idx = r
+        while True:
+            live = idx <= n
+            if not live.any():
+                break
+            tree[rows[live], idx[live]] += 1
+            idx = idx + (idx & -idx)
+    return inversions
+
+
+def kendall_tau_distances(rankings, reference, workers=None):
+    """
+    Kendall-tau distance of each row of rankings to reference.
+
+    :param rankings: 2-D array (m, n); each row a permutation of reference
+    :param reference: 1-D sequence of the n items in reference order
+    :param workers: optional process count; rows are split into that many blocks
+    :return: np.ndarray of m distances (list if NumPy is unavailable)
+    """
+    if np is None:
+        position = {item: i for i, item in enumerate(reference)}
+        return [count_inversions_bit([position[x] for x in row]) for row in rankings]
+
+    relabelled = relabel(rankings, reference)
+    if relabelled.size == 0:
+        return np.zeros(len(relabelled), dtype=np.int64)
+    if not workers or workers < 2 or len(relabelled) < 2 * workers:
+        return batch_inversions(relabelled)
+    blocks = np.array_split(relabelled, workers)
+    with Pool(workers) as pool:
+        return np.concatenate(pool.map(batch_inversions, blocks))
+
+
+if __name__ == "__main__":
+    reference = ['a', 'b', 'c', 'd', 'e']
+    rankings = [
+        ['a', 'b', 'c', 'd', 'e'],  # identical, 0
+        ['e', 'd', 'c', 'b', 'a'],  # reversed, 10
+        ['b', 'a', 'c', 'e', 'd'],  # two adjacent swaps, 2
+    ]
+    print("Distances:", kendall_tau_distances(rankings, reference))
+
+    # Consistency with sort_and_count_inv on random permutations
+    rng = random.Random(2004)
+    n, m = 50, 2000
+    reference = list(range(n))
+    rng.shuffle(reference)
+    rankings = [rng.sample(range(n), n) for _ in range(m)]
+    batch = kendall_tau_distances(rankings, reference, workers=2)
+    position = {item: i for i, item in enumerate(reference)}
+    expected = [sort_and_count_inv([position[x] for x in row], 0, n - 1)[1] for row in rankings]
+    print(f"{m} rankings of {n} items match sort_and_count_inv:", list(batch) == expected)
@@ -1,3 +1,8 @@
+import random
+from array import array as typed_array  # 'array' is merge_sort's parameter name
+from bisect import bisect_left, bisect_right
+
+
 def merge(left, right):
     result = []
     i = j = 0
@@ -13,15 +18,142 @@ def merge(left, right):
     return result
 
 
+# Runs shorter than MIN_RUN are extended with binary insertion sort;
+# MIN_GALLOP consecutive wins from one side switch the merge to galloping.
+MIN_RUN = 32
+MIN_GALLOP = 7
+
+
 def merge_sort(array, lo, hi):
-    if hi > lo:
-        mid = (lo + hi) // 2
-        left_sorted = merge_sort(array[lo:mid+1], 0, mid-lo)
-        right_sorted = merge_sort(array[mid+1:hi+1], 0, hi-mid-1)
-        merged = merge(left_sorted, right_sorted)
-        return merged
-    else:
-        return [array[lo]]
+    """
+    Stable bottom-up natural merge sort of array[lo..hi]; returns a new list.
+    array may be any sliceable sequence (list, tuple, str, array.array, ...).
+
+    Allocates only the result copy and one auxiliary buffer, then ping-pongs
+    between them. Existing ascending runs (and strictly descending runs,
+    reversed in place) are detected up front, so already- or nearly-sorted
+    input needs O(n) comparisons.
+
+    Time Complexity: O(n log n) worst case, O(n) on presorted input
+    Auxiliary Space: O(n)
+    """
+    if hi < lo:
+        return []
+    src = list(array[lo:hi+1])  # the one copy that becomes the result
+    n = len(src)
+    runs = find_runs(src)  # run start indices, terminated by n
+    dst = [None] * n if len(runs) > 2 else None  # the one auxiliary buffer
+    while len(runs) > 2:  # O(log(number of runs)) passes
+        merged = [0]
+        for r in range(0, len(runs) - 1, 2):
+            if r + 2 < len(runs):
+                merge_runs(src, dst, runs[r], runs[r+1], runs[r+2])
+                merged.append(runs[r+2])
+            else:  # odd run out: carried over to the next pass
+                copy_range(src, runs[r], dst, runs[r], n - runs[r])
+                merged.append(n)
+        runs = merged
+        src, dst = dst, src
+    return src
+
+
+def find_runs(array):
+    # Splits array into sorted runs of at least MIN_RUN elements: O(n) on sorted input
+    n = len(array)
+    runs = [0]
+    i = 0
+    while i < n:
+        j = i + 1
+        if j < n and array[j] < array[j-1]:
+            # Strictly descending, so reversing cannot reorder equal keys
+            while j < n and array[j] < array[j-1]:
+                j += 1
+            a, b = i, j - 1
+            while a < b:  # reverse in place by swaps
+                array[a], array[b] = array[b], array[a]
+                a += 1
+                b -= 1
+        else:
+            while j < n and not array[j] < array[j-1]:
+                j += 1
+        if j - i < MIN_RUN:
+            end = min(i + MIN_RUN, n)
+            binary_insertion_sort(array, i, j, end)
+            j = end
+        runs.append(j)
+        i = j
+    return runs
+
+
+def binary_insertion_sort(array, lo, start, end):
+    # array[lo:start] is sorted; inserts array[start:end] into it, stable
+    for t in range(start, end):
+        x = array[t]
+        pos = bisect_right(array, x, lo, t)
+        for m in range(t, pos, -1):  # shift right by one, no slice temporary
+            array[m] = array[m-1]
+        array[pos] = x
+
+
+def gallop_right(key, array, start, end):
+    # First index in array[start:end] holding an element > key (exponential search)
+    prev, step = start, 1
+    while start + step < end and not key < array[start + step]:
+        prev = start + step
+        step *= 2
+    return bisect_right(array, key, prev, min(start + step, end))
+
+
+def gallop_left(key, array, start, end):
+    # First index in array[start:end] holding an element >= key (exponential search)
+    prev, step = start, 1
+    while start + step < end and array[start + step] < key:
+        prev = start + step
+        step *= 2
+    return bisect_left(array, key, prev, min(start + step, end))
+
+
+def copy_range(src, s, dst, d, count):
+    # dst[d:d+count] = src[s:s+count] element by element, without a slice temporary
+    for t in range(count):
+        dst[d + t] = src[s + t]
+
+
+def merge_runs(src, dst, lo, mid, hi):
+    # Merges src[lo:mid] and src[mid:hi] into dst[lo:hi]; ties go to the left run
+    if not src[mid] < src[mid-1]:  # runs already in order
+        copy_range(src, lo, dst, lo, hi - lo)
+        return
+    i, j, k = lo, mid, lo
+    left_wins = right_wins = 0
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP:  # copy every right element < src[i] at once
+                end = gallop_left(src[i], src, j, hi)
+                copy_range(src, j, dst, k, end - j)
+                k += end - j
+                j = end
+                right_wins = 0
+        else:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP and j < hi:  # copy every left element <= src[j]
+                end = gallop_right(src[j], src, i, mid)
+                copy_range(src, i, dst, k, end - i)
+                k += end - i
+                i = end
+                left_wins = 0
+    copy_range(src, i, dst, k, mid - i)
+    k += mid - i
+    copy_range(src, j, dst, k, hi - j)
 
 
 if __name__ == "__main__":
@@ -29,3 +161,25 @@ if __name__ == "__main__":
     sorted_arr = merge_sort(arr, 0, len(arr)-1)
     print("Sorted array:", sorted_arr)
 
+    # Nearly-sorted input: one long run plus a few stragglers
+    log = list(range(1000)) + [5, 3, 999]
+    print("Nearly sorted OK:", merge_sort(log, 0, len(log)-1) == sorted(log))
+
+    # Stability: equal keys keep their original order
+    class Record:
+        def __init__(self, key, tag):
+            self.key, self.tag = key, tag
+        def __lt__(self, other):
+            return self.key < other.key
+        def __repr__(self):
+            return f"{self.key}{self.tag}"
+    records = [Record(k, t) for k, t in zip([2, 1, 2, 1, 3, 2], "abcdef")]
+    print("Stable:", merge_sort(records, 0, len(records)-1))
+
+    # Other sequence types: the result is always a new list
+    print("Tuple:", merge_sort((3, 1, 2), 0, 2))
+    print("String:", merge_sort('cba', 0, 2))
+    packed = typed_array('q', (random.randint(-10**9, 10**9) for _ in range(200)))
+    result = merge_sort(packed, 0, len(packed)-1)
+    print("array('q') OK:", type(result) is list and result == sorted(packed))
+
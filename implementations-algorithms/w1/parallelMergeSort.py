@@ -0,0 +1,151 @@
+# Multi-core merge sort over multiprocessing.shared_memory
+# Phase 1: each worker sorts one contiguous chunk of the shared buffer in place (merge_sort)
+# Phase 2: rounds of pairwise merges; every merge is split into equal slices of output
+#          positions by co-ranking, so all workers stay busy even in the last round
+# Only shared-memory names and index ranges are sent to workers, never the payload.
+# Time Complexity: O((n log n) / P + n log P) with P workers
+# Auxiliary Space: O(n) shared (one ping-pong buffer) + O(n / P) per worker
+
+import random
+import time
+from array import array
+from multiprocessing import Pool, shared_memory
+
+from mergeSort import merge, merge_sort
+
+# Below this size the process start-up costs more than it saves
+PARALLEL_THRESHOLD = 50_000
+
+# Set in each worker by _attach: typed views over the two shared buffers
+_views = None
+_blocks = None
+
+
+def _attach(names, typecode):
+    global _views, _blocks
+    _blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    _views = [block.buf.cast('B').cast(typecode) for block in _blocks]
+
+
+def _sort_chunk(task):
+    # Sorts view[lo:hi] in place
+    lo, hi = task
+    view = _views[0]
+    if hi - lo > 1:
+        view[lo:hi] = array(view.format, merge_sort(view[lo:hi].tolist(), 0, hi - lo - 1))
+
+
+def co_rank(p, view, lo, mid, hi):
+    """
+    Number of elements taken from the left run view[lo:mid] among the first p
+    outputs of the stable merge of view[lo:mid] and view[mid:hi].
+
+    Binary search over the split i + j = p: O(log min(p, run length))
+    """
+    m, n = mid - lo, hi - mid
+    a, b = max(0, p - n), min(p, m)
+    while a < b:
+        i = (a + b) // 2
+        j = p - i
+        if view[lo + i] <= view[mid + j - 1]:  # left[i] must be output before right[j-1]
+            a = i + 1
+        else:
+            b = i
+    return a
+
+
+def _merge_slice(task):
+    # Writes outputs p_start..p_end-1 of merging src[lo:mid] and src[mid:hi] into dst
+    src_id, lo, mid, hi, p_start, p_end = task
+    src, dst = _views[src_id], _views[1 - src_id]
+    i0 = co_rank(p_start, src, lo, mid, hi)
+    i1 = co_rank(p_end, src, lo, mid, hi)
+    j0, j1 = p_start - i0, p_end - i1
+    left = src[lo + i0:lo + i1].tolist()
+    right = src[mid + j0:mid + j1].tolist()
+    dst[lo + p_start:lo + p_end] = array(src.format, merge(left, right))
+
+
+def _shared_typecode(values):
+    # 'q' if every value is an int in int64 range, 'd' if every value is a float,
+    # else None: mixed or wider values would change type or overflow in a typed buffer
+    if all(type(x) is int for x in values):
+        return 'q' if -2**63 <= min(values) and max(values) < 2**63 else None
+    if all(type(x) is float for x in values):
+        return 'd'
+    return None
+
+
+def parallel_merge_sort(array_in, workers=4):
+    """
+    Sorts a sequence of ints or floats on several cores; returns a new list.
+
+    :param array_in: list or array.array of numbers; lists go through shared
+                     memory only if all ints fit int64 or all are floats,
+                     anything else is sorted by merge_sort in this process
+    :param workers: number of worker processes
+    """
+    n = len(array_in)
+    typecode = None
+    if n >= PARALLEL_THRESHOLD and workers >= 2:
+        typecode = array_in.typecode if isinstance(array_in, array) else _shared_typecode(array_in)
+    if typecode is None:
+        return merge_sort(array_in, 0, n - 1)
+    data = array_in if isinstance(array_in, array) else array(typecode, array_in)
+
+    blocks = [shared_memory.SharedMemory(create=True, size=n * data.itemsize) for _ in range(2)]
+    views = [block.buf.cast('B').cast(typecode) for block in blocks]
+    try:
+        views[0][:] = data
+        bounds = [n * w // workers for w in range(workers + 1)]
+        with Pool(workers, initializer=_attach,
+                  initargs=([block.name for block in blocks], typecode)) as pool:
+            pool.map(_sort_chunk, list(zip(bounds, bounds[1:])))
+
+            src_id = 0
+            while len(bounds) > 2:
+                tasks, next_bounds = [], [0]
+                for r in range(0, len(bounds) - 1, 2):
+                    lo = bounds[r]
+                    mid = bounds[r + 1]
+                    hi = bounds[r + 2] if r + 2 < len(bounds) else mid  # odd run out: copied
+                    pieces = max(1, workers * (hi - lo) // n)  # work proportional to size
+                    cuts = [(hi - lo) * s // pieces for s in range(pieces + 1)]
+                    tasks += [(src_id, lo, mid, hi, p0, p1) for p0, p1 in zip(cuts, cuts[1:])]
+                    next_bounds.append(hi)
+                pool.map(_merge_slice, tasks)
+                bounds = next_bounds
+                src_id = 1 - src_id
+        return views[src_id].tolist()
+    finally:
+        for view in views:
+            view.release()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+if __name__ == "__main__":
+    # co_rank: first 4 outputs of merging [1, 3, 5] with [2, 3, 4] take two from the left
+    print("co_rank:", co_rank(4, [1, 3, 5, 2, 3, 4], 0, 3, 6))
+
+    rng = random.Random(2004)
+    # Below PARALLEL_THRESHOLD the input goes straight to merge_sort, array.array included
+    small = array('q', (rng.randint(-10**9, 10**9) for _ in range(2000)))
+    print("sequential fallback, array('q'):", parallel_merge_sort(small, 4) == sorted(small))
+
+    # Mixed ints and floats, or ints beyond int64, stay as Python objects (merge_sort)
+    mixed = [2**53 + 1, 0.5, 2**70] + [rng.randint(0, 100) for _ in range(PARALLEL_THRESHOLD)]
+    print("mixed types kept exact:", parallel_merge_sort(mixed, 4) == sorted(mixed))
+
+    data = [rng.randint(-10**9, 10**9) for _ in range(400_000)]
+    expected = sorted(data)
+
+    start = time.perf_counter()
+    result = merge_sort(data, 0, len(data) - 1)
+    print(f"merge_sort:              {time.perf_counter() - start:.3f}s")
+    for workers in (2, 4, 8):
+        start = time.perf_counter()
+        result = parallel_merge_sort(data, workers)
+        status = "✓" if result == expected else "✗"
+        print(f"parallel_merge_sort({workers}):  {time.perf_counter() - start:.3f}s {status}")
@@ -0,0 +1,185 @@
+# Set algebra on sorted lists of distinct values (e.g. posting lists of ids)
+# Balanced inputs use a two-pointer walk, as in merge: O(m + n).
+# Skewed inputs (|small| * log|large| < |small| + |large|) gallop through the
+# larger list instead: exponential probing from the last position, then
+# lower_bound inside the bracket, so the cost is O(m log(n/m)) for m <= n.
+# Results are written into one preallocated buffer that is truncated in place.
+
+import random
+import time
+from array import array
+
+from binarySearch import lower_bound
+
+
+def gallop(values, key, start):
+    # First index i >= start with values[i] >= key: O(log(i - start))
+    n = len(values)
+    if start >= n or not values[start] < key:
+        return start
+    prev, step = start, 1
+    while start + step < n and values[start + step] < key:
+        prev = start + step
+        step *= 2
+    return lower_bound(values, key, prev + 1, min(start + step + 1, n))
+
+
+def is_skewed(m, n):
+    # True when galloping the larger list beats walking both lists
+    small, large = min(m, n), max(m, n)
+    return small * max(large.bit_length(), 1) < small + large
+
+
+def _copy(out, k, src, lo, hi):
+    # out[k:k + hi - lo] = src[lo:hi] as one slice copy; returns the new k
+    chunk = src[lo:hi]
+    if isinstance(out, array) and not isinstance(chunk, array):
+        chunk = array(out.typecode, chunk)
+    out[k:k + hi - lo] = chunk
+    return k + hi - lo
+
+
+def _finish(out, k):
+    del out[k:]  # works for list and array.array, no copy
+    return out
+
+
+def intersection(a, b, out=None):
+    """
+    Values in both a and b.
+
+    :param out: optional preallocated list/array.array with room for
+                min(len(a), len(b)) values; truncated in place and returned
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    if out is None:
+        out = [None] * len(a)
+    k = j = 0
+    if is_skewed(len(a), len(b)):
+        for x in a:
+            j = gallop(b, x, j)
+            if j == len(b):
+                break
+            if b[j] == x:
+                out[k] = x
+                k += 1
+                j += 1
+    else:
+        i = 0
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                i += 1
+            elif b[j] < a[i]:
+                j += 1
+            else:
+                out[k] = a[i]
+                k += 1
+                i += 1
+                j += 1
+    return _finish(out, k)
+
+
+def difference(a, b, out=None):
+    """Values in a that are not in b; out needs room for len(a) values."""
+    if out is None:
+        out = [None] * len(a)
+    k = i = j = 0
+    if is_skewed(len(a), len(b)) and len(a) <= len(b):
+        for x in a:  # probe each value of a in b
+            j = gallop(b, x, j)
+            if j == len(b) or b[j] != x:
+                out[k] = x
+                k += 1
+        return _finish(out, k)
+    if is_skewed(len(a), len(b)):
+        for y in b:  # copy the stretches of a between values of b in bulk
+            p = gallop(a, y, i)
+            k = _copy(out, k, a, i, p)
+            i = p + 1 if p < len(a) and a[p] == y else p
+    else:
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                out[k] = a[i]
+                k += 1
+                i += 1
+            elif b[j] < a[i]:
+                j += 1
+            else:
+                i += 1
+                j += 1
+    k = _copy(out, k, a, i, len(a))
+    return _finish(out, k)
+
+
+def union(a, b, out=None):
+    """Values in a or b; out needs room for len(a) + len(b) values."""
+    if out is None:
+        out = [None] * (len(a) + len(b))
+    k = i = j = 0
+    if not is_skewed(len(a), len(b)):
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                out[k] = a[i]
+                i += 1
+            elif b[j] < a[i]:
+                out[k] = b[j]
+                j += 1
+            else:  # in both: written once
+                out[k] = a[i]
+                i += 1
+                j += 1
+            k += 1
+        k = _copy(out, k, a, i, len(a))
+        k = _copy(out, k, b, j, len(b))
+        return _finish(out, k)
+
+    if len(a) > len(b):
+        a, b = b, a
+    for x in a:
+        p = gallop(b, x, i)
+        k = _copy(out, k, b, i, p)  # bulk copy of the larger list
+        i = p
+        if i == len(b) or b[i] != x:  # equal values are copied with the next stretch
+            out[k] = x
+            k += 1
+    k = _copy(out, k, b, i, len(b))
+    return _finish(out, k)
+
+
+def k_way_intersection(lists):
+    """
+    Values present in every list. Intersects smallest-first, so every step
+    gallops a candidate set no larger than the smallest input.
+    """
+    if not lists:
+        return []
+    ordered = sorted(lists, key=len)
+    result = list(ordered[0])
+    for other in ordered[1:]:
+        if not result:
+            break
+        result = intersection(result, other, result)  # shrinks in place
+    return result
+
+
+if __name__ == "__main__":
+    a = [1, 3, 5, 7, 9]
+    b = [2, 3, 4, 5, 6]
+    print(f"a = {a}, b = {b}")
+    print(f"union:        {union(a, b)}")
+    print(f"intersection: {intersection(a, b)}")
+    print(f"a - b:        {difference(a, b)}")
+    print(f"k-way:        {k_way_intersection([a, b, [0, 3, 5, 8]])}")
+
+    # Skewed: 10 ids against 10^6 ids
+    rng = random.Random(2004)
+    large = sorted(rng.sample(range(10**7), 10**6))
+    small = sorted(rng.sample(large, 5) + rng.sample(range(10**7), 5))
+    for name, fn in (("intersection", intersection), ("difference", difference), ("union", union)):
+        start = time.perf_counter()
+        got = fn(small, large)
+        elapsed = time.perf_counter() - start
+        sa, sb = set(small), set(large)
+        expected = sorted({"intersection": sa & sb, "difference": sa - sb, "union": sa | sb}[name])
+        print(f"{name:<12} 10 vs 10^6: {elapsed * 1000:.2f} ms {'✓' if got == expected else '✗'}")
@@ -1,34 +1,93 @@
 # Counting Sort Implementation
 # Time Complexity: O(n + k), where n is the number of elements and k is the range of input values
-# Auxiliary Space Complexity: O(n + k)
+# Auxiliary Space Complexity: O(k) dense, O(distinct values) sparse
 
-def counting_sort(arr):
-    if not arr:
+from array import array
+
+from radixSort import radix_sort_vectorized
+
+try:
+    import numpy as np
+except ImportError:  # dense path falls back to an array('q') histogram
+    np = None
+
+# Ratio of value range k to n above which the count array is considered sparse
+# (most buckets empty) and a hash histogram is used instead.
+SPARSE_RANGE_RATIO = 4
+COUNT_BYTES = 8  # one int64 counter per bucket
+INT64_MIN, INT64_MAX = -2**63, 2**63 - 1
+
+
+def counting_sort(arr, max_count_bytes=None):
+    """
+    Sorts a list or 1-D integer array in place.
+
+    Dense inputs (k <= SPARSE_RANGE_RATIO * n) count into a flat int64 array and
+    rewrite arr straight from the counts, with no output copy.
+    Sparse inputs, or any input whose count array would exceed max_count_bytes,
+    use a hash histogram of the distinct values instead, so one outlier such as
+    a 10^9 sentinel costs O(distinct values) memory rather than O(10^9).
+
+    :param arr: list or np.ndarray of integers
+    :param max_count_bytes: optional ceiling in bytes for the dense count array
+                            only; the sparse path it falls back to still needs
+                            O(distinct values) memory (about 100 bytes each)
+    :return: arr, sorted in place
+    """
+    if len(arr) == 0:
         return arr  # O(1)
     max_val = max(arr)  # O(n)
     min_val = min(arr)  # O(n)
-    k = max_val - min_val + 1  # O(1)
-    count = [0] * k  # O(k)
-    output = [0] * len(arr)  # O(n)
+    k = int(max_val) - int(min_val) + 1  # O(1)
+
+    too_big = max_count_bytes is not None and k * COUNT_BYTES > max_count_bytes
+    wide = not (INT64_MIN <= min_val and max_val <= INT64_MAX)  # dense offsets are int64
+    if k > SPARSE_RANGE_RATIO * len(arr) or too_big or wide:
+        return counting_sort_sparse(arr)
+    return counting_sort_dense(arr, int(min_val), k)
 
-    # Count occurrences
+
+def counting_sort_dense(arr, min_val, k):
+    # Time Complexity: O(n + k), Auxiliary Space: O(k)
+    if np is not None and isinstance(arr, np.ndarray):
+        # Offsets in int64: arr - min_val in a narrow dtype (e.g. int8) would overflow
+        count = np.bincount(np.subtract(arr, min_val, dtype=np.int64), minlength=k)  # O(n + k)
+        arr[:] = np.repeat(np.arange(min_val, min_val + k, dtype=np.int64), count)  # O(n + k)
+        return arr
+
+    count = array('q', [0]) * k  # O(k), 8 bytes per bucket
     for num in arr:  # O(n)
-        count[num - min_val] += 1  # O(1)
+        count[num - min_val] += 1
+
+    # Rewrite arr from the counts; ints carry no satellite data, so this is
+    # equivalent to the stable placement pass without the output copy
+    i = 0
+    for v in range(k):  # O(n + k)
+        for _ in range(count[v]):
+            arr[i] = v + min_val
+            i += 1
+    return arr
 
-    # Accumulate counts
-    for i in range(1, k):  # O(k)
-        count[i] += count[i - 1]  # O(1)
 
-    # Build output array (stable sort)
-    for i in range(len(arr) - 1, -1, -1):  # O(n)
-        output[count[arr[i] - min_val] - 1] = arr[i]  # O(1)
-        count[arr[i] - min_val] -= 1  # O(1)
+def counting_sort_sparse(arr):
+    # Time Complexity: O(n + u), u = number of distinct values (radix-sorted)
+    # Auxiliary Space: O(u)
+    count = {}
+    for num in arr:  # O(n)
+        count[num] = count.get(num, 0) + 1
+    if INT64_MIN <= min(count) and max(count) <= INT64_MAX:
+        distinct = radix_sort_vectorized(array('q', count))  # O(u)
+    else:  # keys wider than int64 (e.g. uint64 >= 2^63) do not fit array('q')
+        distinct = sorted(count)  # O(u log u)
 
-    # Copy output to arr
-    for i in range(len(arr)):  # O(n)
-        arr[i] = output[i]  # O(1)
+    i = 0
+    for v in distinct:  # O(n)
+        for _ in range(count[v]):
+            arr[i] = v
+            i += 1
     return arr
 
+
 if __name__ == "__main__":
     test_cases = [
         [],  # empty
@@ -40,9 +99,27 @@ if __name__ == "__main__":
         [0, 2, 0, 2, 1],  # with zero
         [100, 50, 200, 25, 75],  # large values
         [0],  # single zero
+        [3, -2, 7, -2, 0],  # negatives
+        [5, 1, 10**9, 3, 1],  # one outlier -> sparse path
     ]
     for arr in test_cases:
         arr_copy = arr.copy()
         counting_sort(arr_copy)
         print(f"Original: {arr}\nSorted:   {arr_copy}\n")
 
+    # Range 1..10^6 would need 8 MB of counters; a 64 KB ceiling forces the sparse path
+    arr = [10**6, 1, 500, 1, 42]
+    counting_sort(arr, max_count_bytes=64 * 1024)
+    print(f"With max_count_bytes=64KB: {arr}")
+
+    # Keys outside int64 take the sparse path with a comparison sort of the distinct keys
+    arr = [2**63, 0, 2**64 + 5, 0]
+    counting_sort(arr)
+    print(f"Beyond int64: {arr}")
+
+    # int8 array spanning its full range: offsets are computed in int64
+    if np is not None:
+        small = np.random.default_rng(2004).integers(-128, 128, 1000).astype(np.int8)
+        expected = np.sort(small)
+        counting_sort(small)
+        print(f"int8 full range: {'✓' if (small == expected).all() else '✗'}")
@@ -1,3 +1,17 @@
+import mmap
+import os
+import random
+import struct
+import tempfile
+from array import array
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+except ImportError:  # chunked scans fall back to find_min_max per chunk
+    np = None
+
+
 def find_min(array):
     if not array:
         raise ValueError("Array must have at least one element.")
@@ -11,6 +25,132 @@ def find_min(array):
     return min_val
 
 
+def find_min_max(array):
+    """
+    Minimum and maximum together using the paired-comparison trick.
+
+    Elements are taken two at a time: the pair is compared once, then only the
+    smaller is compared with the running min and the larger with the running
+    max, so about 3n/2 comparisons are needed instead of 2n.
+    Ties report the first index, like find_min.
+
+    :return: (min_val, argmin, max_val, argmax)
+    """
+    if not array:
+        raise ValueError("Array must have at least one element.")
+    N = len(array)
+    min_val = max_val = array[0]
+    min_idx = max_idx = 0
+    index = 1 if N % 2 else 0  # odd length: array[0] seeds both; even: first pair does
+    if index == 0:
+        if array[1] < array[0]:
+            min_val, min_idx = array[1], 1
+        else:
+            max_val, max_idx = array[1], 1 if array[0] < array[1] else 0
+        index = 2
+    while index < N - 1:
+        a, b = array[index], array[index + 1]
+        if b < a:  # 1 comparison per pair
+            small, small_idx, large, large_idx = b, index + 1, a, index
+        else:
+            small, small_idx, large, large_idx = a, index, b, index + 1
+        if small < min_val:  # 1 comparison
+            min_val, min_idx = small, small_idx
+        if large > max_val:  # 1 comparison
+            # equal pair: the larger is also at index, the first occurrence
+            max_val, max_idx = large, index if a == b else large_idx
+        index += 2
+    return min_val, min_idx, max_val, max_idx
+
+
+def find_min_max_chunked(buffer, chunk_size=1 << 20, offset=0):
+    """
+    find_min_max over a large contiguous buffer, one chunk at a time.
+
+    With NumPy, each chunk of an ndarray, np.memmap or array.array is reduced
+    with argmin/argmax (vectorized, first occurrence); otherwise each chunk goes
+    through find_min_max. Only one chunk is resident at a time for memmaps.
+
+    :param offset: added to the reported indices (used by the parallel scan)
+    :return: (min_val, argmin, max_val, argmax)
+    """
+    n = len(buffer)
+    if n == 0:
+        raise ValueError("Array must have at least one element.")
+    if np is not None and not isinstance(buffer, np.ndarray):
+        try:
+            buffer = np.frombuffer(buffer, dtype=np.dtype(buffer.typecode))
+        except (AttributeError, TypeError):
+            pass
+    best = None
+    for start in range(0, n, chunk_size):
+        chunk = buffer[start:start + chunk_size]
+        if np is not None and isinstance(chunk, np.ndarray):
+            lo, hi = int(chunk.argmin()), int(chunk.argmax())
+            result = (chunk[lo].item(), lo, chunk[hi].item(), hi)
+        else:
+            result = find_min_max(chunk)
+        best = combine(best, result, start + offset)
+    return best
+
+
+def combine(best, result, offset=0):
+    # Merges a (min, argmin, max, argmax) result found at offset into best
+    mn, mn_i, mx, mx_i = result
+    mn_i, mx_i = mn_i + offset, mx_i + offset
+    if best is None:
+        return mn, mn_i, mx, mx_i
+    b_mn, b_mn_i, b_mx, b_mx_i = best
+    if mn < b_mn or (mn == b_mn and mn_i < b_mn_i):
+        b_mn, b_mn_i = mn, mn_i
+    if mx > b_mx or (mx == b_mx and mx_i < b_mx_i):
+        b_mx, b_mx_i = mx, mx_i
+    return b_mn, b_mn_i, b_mx, b_mx_i
+
+
+def _scan_file_range(task):
+    # Worker: maps only its own slice of the file and reduces it chunk by chunk
+    path, typecode, lo, hi, chunk_size = task
+    itemsize = struct.calcsize(typecode)
+    if np is not None:
+        view = np.memmap(path, dtype=np.dtype(typecode), mode='r',
+                         offset=lo * itemsize, shape=(hi - lo,))
+        return find_min_max_chunked(view, chunk_size, offset=lo)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        view = memoryview(m).cast(typecode)[lo:hi]
+        try:
+            return find_min_max_chunked(view, chunk_size, offset=lo)
+        finally:
+            view.release()
+
+
+def find_min_max_file(path, typecode='d', workers=4, chunk_size=1 << 20):
+    """
+    find_min_max over a binary file of packed numbers, split across processes.
+
+    Workers receive only (path, range) and memory-map their own slice, so no
+    data is pickled; the per-worker results are combined in the parent.
+
+    :param typecode: array/struct typecode of one value, e.g. 'd' or 'q'
+    :return: (min_val, argmin, max_val, argmax) with indices into the file
+    """
+    n = os.path.getsize(path) // struct.calcsize(typecode)
+    if n == 0:
+        raise ValueError("Array must have at least one element.")
+    workers = max(1, min(workers, n))
+    bounds = [n * w // workers for w in range(workers + 1)]
+    tasks = [(path, typecode, lo, hi, chunk_size) for lo, hi in zip(bounds, bounds[1:])]
+    if workers == 1:
+        results = [_scan_file_range(tasks[0])]
+    else:
+        with Pool(workers) as pool:
+            results = pool.map(_scan_file_range, tasks)
+    best = None
+    for result in results:
+        best = combine(best, result)
+    return best
+
+
 if __name__ == "__main__":
     test_cases = [
         [3, 1, 4, 1, 5, 9, 2, 6],    # typical unsorted
@@ -20,5 +160,17 @@ if __name__ == "__main__":
         [100, 50, 200, 25, 75],      # mixed
     ]
     for arr in test_cases:
-        print(f"Array: {arr}\nMin: {find_min(arr)}\n")
+        print(f"Array: {arr}\nMin: {find_min(arr)}")
+        print(f"(min, argmin, max, argmax): {find_min_max(arr)}\n")
+
+    # Sensor readings: in-memory buffer, then the same data as a file
+    rng = random.Random(2004)
+    readings = array('d', (rng.gauss(20, 5) for _ in range(1_000_000)))
+    expected = (min(readings), readings.index(min(readings)), max(readings), readings.index(max(readings)))
+    print("chunked matches:", find_min_max_chunked(readings, chunk_size=1 << 16) == expected)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sensor.bin')
+        with open(path, 'wb') as f:
+            readings.tofile(f)
+        print("file (4 workers) matches:", find_min_max_file(path, 'd', workers=4) == expected)
 
@@ -2,6 +2,16 @@
 # Time Complexity: O(d*(n+b)), where d is the number of digits, n is the number of elements, b is the base (10 for decimal)
 # Auxiliary Space: O(n + b)
 
+import random
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # the vectorized backend falls back to pure Python
+    np = None
+
+
 def get_digit(number, base, digit):
     # Returns the digit at the given place (1-based, rightmost is 1)
     return (number // (base ** (digit - 1))) % base
@@ -33,8 +43,15 @@ def radix_pass(arr, base, digit):
         arr[i] = temp[i]
 
 def radix_sort(arr, base=10):
-    if not arr:
+    if len(arr) == 0:
+        return arr
+    # Integer memory-mapped files are sorted in place with bounded scratch memory
+    if np is not None and isinstance(arr, np.memmap) and arr.dtype.kind in 'iu':
+        radix_sort_inplace(arr)
         return arr
+    # Contiguous integer buffers go to the byte-wise engine below
+    if isinstance(arr, array) or (np is not None and isinstance(arr, np.ndarray)):
+        return radix_sort_vectorized(arr)
     max_val = max(arr)
     digits = 1
     while max_val >= base ** digits:
@@ -43,6 +60,308 @@ def radix_sort(arr, base=10):
         radix_pass(arr, base, digit)
     return arr
 
+
+# ------------------ VECTORIZED BACKEND ------------------
+# LSD radix sort on contiguous integer arrays (np.ndarray or array('q'/'i'/...))
+# Digits are `bits` wide (8 -> base 256, 11 -> base 2048) and extracted with
+# shift/mask instead of get_digit's division by base ** (digit - 1).
+# Negative keys are handled by flipping the sign bit, which maps the signed
+# range onto the unsigned range while preserving order.
+# Time Complexity: O(w/bits * (n + 2^bits)), w = key width in bits
+# Auxiliary Space: O(n + 2^bits)
+
+def _signed_to_unsigned_keys(values):
+    # Order-preserving map onto uint64 keys: O(n)
+    if values.dtype.kind == 'u':
+        return values.astype(np.uint64)
+    if values.dtype.itemsize == 8:
+        # Convert to native int64 first: viewing big-endian bytes would scramble the keys
+        return values.astype(np.int64, copy=False).view(np.uint64) ^ np.uint64(1 << 63)  # flip the sign bit
+    return (values.astype(np.int64) + (1 << (values.dtype.itemsize * 8 - 1))).astype(np.uint64)
+
+
+def radix_pass_vectorized(keys, order, bits, shift):
+    """
+    One stable counting pass over the digit at bit offset `shift`.
+
+    The histogram is np.bincount; the stable scatter is a stable argsort of
+    the uint8/uint16 digit array, which NumPy runs as a counting sort for
+    keys of 16 bits or fewer.
+    Returns the new (keys, order), or the inputs unchanged when every key
+    shares this digit (the pass would be the identity permutation).
+    """
+    mask = (1 << bits) - 1
+    digit_dtype = np.uint8 if bits <= 8 else np.uint16
+    digits = ((keys >> np.uint64(shift)) & np.uint64(mask)).astype(digit_dtype)  # O(n)
+    counter = np.bincount(digits, minlength=mask + 1)  # O(n + base)
+    if counter.max() == len(keys):
+        return keys, order
+    perm = np.argsort(digits, kind='stable')  # O(n + base)
+    return keys[perm], order[perm]
+
+
+def radix_sort_vectorized(arr, bits=8):
+    """
+    Sorts a contiguous integer array in place using base 2^bits LSD passes.
+
+    :param arr: np.ndarray of integers, or array.array of an integer typecode
+    :param bits: digit width, 8 (base 256) or 11 (base 2048)
+    :return: arr, sorted in place
+    """
+    if len(arr) == 0:
+        return arr
+    if np is None:
+        return _radix_sort_bytes_python(arr, bits)
+
+    values = np.frombuffer(arr, dtype=np.dtype(arr.typecode)) if isinstance(arr, array) else arr
+    if values.dtype.kind not in 'iu':
+        raise TypeError("radix_sort_vectorized requires an integer array")
+
+    keys = _signed_to_unsigned_keys(values)
+    order = np.arange(len(values))
+    width = int(keys.max()).bit_length()  # skip passes above the largest key
+    for shift in range(0, width, bits):
+        keys, order = radix_pass_vectorized(keys, order, bits, shift)
+
+    values[:] = values[order]  # writes through to the array('q') buffer too
+    return arr
+
+
+def _radix_sort_bytes_python(arr, bits):
+    # Pure-Python fallback: same passes as radix_pass, but digits come from
+    # shift/mask and each pass writes into one reused scratch buffer.
+    n = len(arr)
+    mask = (1 << bits) - 1
+    offset = -min(min(arr), 0)  # shift negatives into the non-negative range
+    keys = [x + offset for x in arr]
+    temp = [0] * n
+    width = max(keys).bit_length()
+    for shift in range(0, width, bits):
+        counter = [0] * (mask + 1)
+        for key in keys:  # O(n)
+            counter[(key >> shift) & mask] += 1
+        position = [0] * (mask + 1)
+        for v in range(1, mask + 1):  # O(base)
+            position[v] = position[v - 1] + counter[v - 1]
+        for key in keys:  # O(n), stable
+            d = (key >> shift) & mask
+            temp[position[d]] = key
+            position[d] += 1
+        keys, temp = temp, keys
+    for i in range(n):
+        arr[i] = keys[i] - offset
+    return arr
+
+
+# ------------------ KEY-BASED RECORD SORT ------------------
+# Sorts arbitrary records by an integer key without comparing records.
+# Each key is extracted exactly once; passes permute a compact index array
+# and the records themselves move only once, at the end.
+# Time Complexity: O(n + d*(n+b)), d = number of base-b digits of the largest key
+# Auxiliary Space: O(n + b)
+
+def radix_pass_indexed(keys, index, temp, bits, shift):
+    # radix_pass over index, reading the digit of keys[index[i]]: O(n + b)
+    mask = (1 << bits) - 1
+    counter = [0] * (mask + 1)
+    for i in index:  # O(n)
+        counter[(keys[i] >> shift) & mask] += 1
+    position = [0] * (mask + 1)
+    for v in range(1, mask + 1):  # O(b)
+        position[v] = position[v - 1] + counter[v - 1]
+    for i in index:  # O(n), stable
+        d = (keys[i] >> shift) & mask
+        temp[position[d]] = i
+        position[d] += 1
+
+
+def radix_sort_by(records, key, bits=8):
+    """
+    Stable radix sort of records by integer key, in place.
+
+    :param records: list of arbitrary objects, e.g. (timestamp, payload) tuples
+    :param key: function mapping a record to an int (may be negative)
+    :param bits: digit width of each pass (base 2^bits)
+    :return: records, sorted in place
+    """
+    n = len(records)
+    if n == 0:
+        return records
+    keys = [key(r) for r in records]  # O(n), every key extracted once
+    offset = -min(min(keys), 0)
+    if offset:
+        keys = [k + offset for k in keys]
+    width = max(keys).bit_length()
+
+    if np is not None and width < 64:
+        packed = np.array(keys, dtype=np.uint64)
+        order = np.arange(n)
+        for shift in range(0, width, bits):
+            packed, order = radix_pass_vectorized(packed, order, bits, shift)
+        index = order.tolist()
+    else:
+        keys = array('Q', keys) if width <= 64 else keys
+        index = list(range(n))
+        temp = [0] * n
+        for shift in range(0, width, bits):
+            radix_pass_indexed(keys, index, temp, bits, shift)
+            index, temp = temp, index
+
+    records[:] = [records[i] for i in index]  # O(n), the only record move
+    return records
+
+
+# ------------------ IN-PLACE MSD (AMERICAN FLAG) SORT ------------------
+# Sorts an np.memmap (or any integer ndarray) without an O(n) temp array.
+# Each pass histograms one byte by streaming scratch-sized blocks, then moves
+# elements into their buckets block by block: a block read from the first
+# unplaced slot of bucket b is split by digit, every element is written to the
+# next free slot of its bucket, and the elements it displaces there are written
+# back into b's window to be examined next. Every block read places all of its
+# elements, so a pass moves each element O(1) times.
+# Buckets that fit in the scratch buffer are sorted in memory and written back.
+# Time Complexity: O(n * w / 8) element moves, w = key width in bits
+# Auxiliary Space: O(scratch) plus 256 counters per pending bucket
+
+SCRATCH_ELEMENTS = 1 << 22  # 32 MB of int64 per scratch buffer
+
+
+def _byte_digits(block, shift):
+    # Byte at bit offset shift of each order-preserving unsigned key: O(len(block))
+    keys = _signed_to_unsigned_keys(block)
+    return ((keys >> np.uint64(shift)) & np.uint64(0xFF)).astype(np.intp)
+
+
+def american_flag_pass(buf, lo, hi, shift, scratch, stats):
+    """
+    Permutes buf[lo:hi] in place into 256 buckets by the byte at `shift`.
+    Returns the bucket boundaries (257 offsets into buf).
+    """
+    counter = np.zeros(256, dtype=np.int64)
+    for s in range(lo, hi, scratch):  # histogram: one streaming read
+        block = buf[s:min(s + scratch, hi)]
+        counter += np.bincount(_byte_digits(block, shift), minlength=256)
+        stats['bytes_read'] += block.nbytes
+    bounds = np.concatenate(([0], np.cumsum(counter))) + lo
+    head = bounds[:-1].copy()  # next unplaced slot of each bucket
+    tail = bounds[1:]
+
+    half = max(1, scratch // 2)  # block read + displaced elements share the scratch
+    for b in range(256):
+        while head[b] < tail[b]:
+            h = int(head[b])
+            size = min(half, int(tail[b]) - h)
+            block = np.array(buf[h:h + size])
+            digits = _byte_digits(block, shift)
+            order = np.argsort(digits, kind='stable')
+            block, digits = block[order], digits[order]
+            counts = np.bincount(digits, minlength=256)
+            stats['bytes_read'] += block.nbytes
+
+            displaced = []
+            pos = 0
+            for c in np.flatnonzero(counts):
+                segment = block[pos:pos + counts[c]]
+                pos += counts[c]
+                start = int(head[c])
+                if c != b:
+                    displaced.append(np.array(buf[start:start + len(segment)]))
+                    stats['bytes_read'] += segment.nbytes
+                else:
+                    start = h  # b's own elements stay at the front of its window
+                buf[start:start + len(segment)] = segment
+                stats['bytes_written'] += segment.nbytes
+                head[c] += len(segment)
+            if displaced:
+                # Unplaced elements move into the rest of b's window
+                rest = np.concatenate(displaced)
+                buf[int(head[b]):int(head[b]) + len(rest)] = rest
+                stats['bytes_written'] += rest.nbytes
+    return bounds
+
+
+def radix_sort_inplace(buf, scratch=SCRATCH_ELEMENTS, progress=None):
+    """
+    In-place MSD radix sort of an integer np.memmap / ndarray.
+
+    :param buf: writable 1-D integer array, e.g. np.memmap(path, '<i8', mode='r+')
+    :param scratch: elements held in memory at once (bounds RAM use)
+    :param progress: optional callback, called with the stats dict after each
+                     pass or in-memory bucket sort
+    :return: stats dict: elements sorted, passes, bytes read/written,
+             seconds and throughput in MB/s
+    """
+    if np is None:
+        raise ImportError("radix_sort_inplace requires NumPy")
+    if buf.dtype.kind not in 'iu':  # float keys would be truncated into wrong buckets
+        raise TypeError("radix_sort_inplace requires an integer array")
+    n = len(buf)
+    stats = {'n': n, 'sorted': 0, 'passes': 0, 'bytes_read': 0, 'bytes_written': 0,
+             'seconds': 0.0, 'mb_per_s': 0.0}
+    start_time = time.perf_counter()
+
+    def report(done):
+        stats['sorted'] += done
+        stats['seconds'] = time.perf_counter() - start_time
+        moved = stats['bytes_read'] + stats['bytes_written']
+        stats['mb_per_s'] = moved / 1e6 / stats['seconds'] if stats['seconds'] else 0.0
+        if progress is not None:
+            progress(stats)
+
+    stack = [(0, n, buf.dtype.itemsize * 8 - 8)]  # (lo, hi, shift of the digit to sort on)
+    while stack:
+        lo, hi, shift = stack.pop()
+        if hi - lo <= scratch:
+            block = np.array(buf[lo:hi])
+            block.sort()
+            buf[lo:hi] = block
+            stats['bytes_read'] += block.nbytes
+            stats['bytes_written'] += block.nbytes
+            report(hi - lo)
+            continue
+        bounds = american_flag_pass(buf, lo, hi, shift, scratch, stats)
+        stats['passes'] += 1
+        done = 0
+        for b in range(256):
+            s, e = int(bounds[b]), int(bounds[b + 1])
+            if e - s > 1 and shift > 0:
+                stack.append((s, e, shift - 8))
+            else:
+                done += e - s  # single element or all bytes consumed: final
+        report(done)
+    if isinstance(buf, np.memmap):
+        buf.flush()
+    return stats
+
+
+def benchmark(n=200_000, max_val=10**9, seed=2004):
+    """Times radix_pass-based radix_sort, sorted() and the vectorized engine on the same data."""
+    rng = random.Random(seed)
+    data = [rng.randint(0, max_val) for _ in range(n)]
+    expected = sorted(data)
+    results = []
+
+    start = time.perf_counter()
+    sorted(data)
+    results.append(("sorted()", time.perf_counter() - start))
+
+    for base in (10, 256):
+        lst = data.copy()
+        start = time.perf_counter()
+        radix_sort(lst, base)
+        results.append((f"radix_sort (radix_pass, base {base})", time.perf_counter() - start))
+        assert lst == expected
+
+    for bits in (8, 11):
+        buf = array('q', data)
+        start = time.perf_counter()
+        radix_sort_vectorized(buf, bits)
+        results.append((f"radix_sort_vectorized (base 2^{bits})", time.perf_counter() - start))
+        assert list(buf) == expected
+
+    return results
+
+
 if __name__ == "__main__":
     test_cases = [
         [],
@@ -60,3 +379,45 @@ if __name__ == "__main__":
         arr_copy = arr.copy()
         radix_sort(arr_copy)
         print(f"Original: {arr}\nSorted:   {arr_copy}\n")
+
+    # Vectorized backend, including negative keys
+    for arr in test_cases + [[-5, 3, -1, 0, 2**40, -2**40, 7]]:
+        buf = array('q', arr)
+        radix_sort(buf)
+        status = "✓" if list(buf) == sorted(arr) else "✗"
+        print(f"array('q') {arr} -> {list(buf)} {status}")
+
+    # Records sorted by key; equal keys keep their input order (stable)
+    events = [(1700, "b"), (-3, "a"), (1700, "a"), (42, "c"), (-3, "b")]
+    print(f"\nrecords:   {events}")
+    print(f"by key:    {radix_sort_by(events.copy(), key=lambda r: r[0])}")
+
+    # In-place sort of a memory-mapped file with a 64K-element scratch buffer
+    import os
+    import tempfile
+    if np is not None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'keys.bin')
+            data = np.random.default_rng(7).integers(-2**62, 2**62, 1_000_000)
+            data.tofile(path)
+            mapped = np.memmap(path, dtype=np.int64, mode='r+')
+            stats = radix_sort_inplace(mapped, scratch=1 << 16)
+            status = "✓" if (mapped == np.sort(data)).all() else "✗"
+            print(f"\nmemmap in place: {stats['passes']} passes, "
+                  f"{(stats['bytes_read'] + stats['bytes_written']) / 1e6:.0f} MB moved, "
+                  f"{stats['mb_per_s']:.0f} MB/s {status}")
+            del mapped
+
+            # Big-endian file: keys are mapped in native byte order before bucketing
+            path = os.path.join(tmp, 'keys_be.bin')
+            data = data[:100_000].astype('>i8')
+            data.tofile(path)
+            mapped = np.memmap(path, dtype='>i8', mode='r+')
+            radix_sort_inplace(mapped, scratch=1000)
+            status = "✓" if (mapped == np.sort(data)).all() else "✗"
+            print(f"big-endian memmap in place {status}")
+            del mapped
+
+    print("\nBenchmark (seconds):")
+    for name, seconds in benchmark(n=50_000):
+        print(f"  {name:<40} {seconds:.4f}")
@@ -0,0 +1,123 @@
+# Adaptive sort dispatcher: samples the input, then picks counting, radix or merge sort
+# Features (O(n) type and min/max scans plus an O(m log m) sample, m = SAMPLE_SIZE):
+#   - value range k vs n          -> counting_sort when the count array is dense
+#   - key width (int64 or wider)  -> radix_sort on a compact array('q') otherwise
+#   - presortedness: inversions of a sample, via countInversions -> natural merge_sort
+#     when the input is (nearly) sorted or reversed, since it then runs in ~O(n)
+# Non-integer keys always go to merge_sort.
+
+import os
+import random
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'w1'))
+from countInversions import count_inversions_bit  # noqa: E402
+from mergeSort import merge_sort  # noqa: E402
+
+from countingSort import SPARSE_RANGE_RATIO, counting_sort
+from radixSort import radix_sort_vectorized
+
+SAMPLE_SIZE = 1024
+# Sampled inversion fraction at or below this (or at or above 1 - this) counts as presorted
+PRESORTED_FRACTION = 0.01
+INT64_MIN, INT64_MAX = -2**63, 2**63 - 1
+
+
+def sample_features(arr, sample_size=SAMPLE_SIZE, seed=None):
+    """
+    Cheap description of arr used to pick a sort engine.
+
+    The sample keeps positions in index order, so its inversion fraction
+    (inversions / pairs) estimates how far arr is from sorted: ~0 sorted,
+    ~0.5 random, ~1 reversed.
+    """
+    n = len(arr)
+    rng = random.Random(seed)
+    positions = sorted(rng.sample(range(n), sample_size)) if n > sample_size else range(n)
+    sample = [arr[i] for i in positions]
+    m = len(sample)
+    pairs = m * (m - 1) // 2
+    features = {
+        'n': n,
+        'ints': all(isinstance(x, int) for x in sample),
+        'inversion_fraction': count_inversions_bit(sample) / pairs if pairs else 0.0,
+    }
+    if features['ints']:
+        # O(n), exact: one unsampled float would break counting_sort / array('q')
+        features['ints'] = all(isinstance(x, int) for x in arr)
+    if features['ints'] and n:
+        lo, hi = min(arr), max(arr)  # O(n), exact: counting_sort needs the true range
+        features['range'] = hi - lo + 1
+        features['key_bits'] = max(abs(lo), abs(hi)).bit_length() + (lo < 0)
+        features['fits_int64'] = INT64_MIN <= lo and hi <= INT64_MAX
+    return features
+
+
+def choose_engine(features):
+    # Returns (engine name, reason) for the features from sample_features
+    n = features['n']
+    if n < 2:
+        return 'none', 'fewer than two elements'
+    inv = features['inversion_fraction']
+    if inv <= PRESORTED_FRACTION or inv >= 1 - PRESORTED_FRACTION:
+        return 'merge', f'presorted (sampled inversion fraction {inv:.3f})'
+    if not features['ints']:
+        return 'merge', 'non-integer keys'
+    if features['range'] <= SPARSE_RANGE_RATIO * n:
+        return 'counting', f"dense range ({features['range']} values for n={n})"
+    if features['fits_int64']:
+        return 'radix', f"sparse range, {features['key_bits']}-bit keys"
+    return 'merge', 'keys wider than 64 bits'
+
+
+def smart_sort(arr, stats=None):
+    """
+    Sorts a list in place with the engine that suits it best.
+
+    :param stats: optional dict, filled with the features, the chosen engine,
+                  the reason, and 'sample_seconds' / 'sort_seconds' for logging
+    :return: arr
+    """
+    start = time.perf_counter()
+    features = sample_features(arr)
+    engine, reason = choose_engine(features)
+    sampled = time.perf_counter()
+
+    if engine == 'counting':
+        counting_sort(arr)
+    elif engine == 'radix':
+        buf = array('q', arr)
+        radix_sort_vectorized(buf)
+        arr[:] = buf.tolist()
+    elif engine == 'merge':
+        arr[:] = merge_sort(arr, 0, len(arr) - 1)
+
+    if stats is not None:
+        stats.update(features)
+        stats.update(engine=engine, reason=reason,
+                     sample_seconds=sampled - start,
+                     sort_seconds=time.perf_counter() - sampled)
+    return arr
+
+
+if __name__ == "__main__":
+    rng = random.Random(2004)
+    n = 200_000
+    batches = {
+        'small range': [rng.randint(0, 1000) for _ in range(n)],
+        'wide range': [rng.randint(-10**12, 10**12) for _ in range(n)],
+        'nearly sorted': sorted(rng.randint(0, 10**12) for _ in range(n))[:-20] + [rng.randint(0, 10**12) for _ in range(20)],
+        'reversed': list(range(n, 0, -1)),
+        'floats': [rng.random() for _ in range(n)],
+        'empty': [],
+        'one float': [rng.randint(0, 1000) for _ in range(n - 1)] + [2.5],
+    }
+    for name, data in batches.items():
+        expected = sorted(data)
+        stats = {}
+        smart_sort(data, stats)
+        status = "✓" if data == expected else "✗"
+        print(f"{name:<14} -> {stats['engine']:<8} ({stats['reason']}) "
+              f"sample {stats['sample_seconds'] * 1000:.1f} ms, sort {stats['sort_seconds'] * 1000:.1f} ms {status}")
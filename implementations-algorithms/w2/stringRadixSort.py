@@ -0,0 +1,123 @@
+# MSD radix sort for byte-string keys, with three-way string quicksort for small buckets
+# Large ranges: one counting pass on the byte at position d (the same count / position /
+#   place / copy-back steps as radix_pass, over 256 byte values plus "end of string"),
+#   then each bucket is sorted on position d + 1.
+# Small ranges: three-way (DNF) partition on the byte at position d, recursing on d + 1
+#   only for the equal region.
+# Each key is examined only up to its distinguishing prefix (plus one byte), so the
+# shared prefixes of URL-like keys are not re-compared as in comparison sorts.
+# Time Complexity: O(D + n * 257 / CUTOFF), D = total length of distinguishing prefixes
+# Auxiliary Space: O(n + 257) plus the explicit work stack
+
+import random
+
+CUTOFF = 32  # ranges this small use three-way string quicksort
+BASE = 257  # 256 byte values + end-of-string (sorts first)
+
+
+def char_at(s, d):
+    # Byte d of s shifted by one, or 0 past the end (so shorter keys sort first)
+    return s[d] + 1 if d < len(s) else 0
+
+
+def msd_radix_pass(A, aux, lo, hi, d):
+    """
+    Stable counting pass of A[lo..hi] on byte d; returns the bucket start
+    offsets (position array) so the caller can recurse into each bucket.
+    """
+    counter = [0] * BASE  # O(BASE)
+    position = [0] * (BASE + 1)
+
+    # Step 1: Count occurrences
+    for i in range(lo, hi + 1):  # O(n)
+        counter[char_at(A[i], d)] += 1
+
+    # Step 2: Compute positions
+    for v in range(1, BASE + 1):  # O(BASE)
+        position[v] = position[v - 1] + counter[v - 1]
+    starts = position[:]
+
+    # Step 3: Place elements in aux (stable)
+    for i in range(lo, hi + 1):  # O(n)
+        c = char_at(A[i], d)
+        aux[position[c]] = A[i]
+        position[c] += 1
+
+    # Step 4: Copy back
+    A[lo:hi + 1] = aux[:hi - lo + 1]
+    return starts
+
+
+def dnf_partition_at(A, lo, hi, d, pivot):
+    """
+    dnf_partition on byte d: A[lo..lt-1] < pivot, A[lt..gt] == pivot,
+    A[gt+1..hi] > pivot (comparing char_at(., d) only). Returns (lt, gt).
+    """
+    lt = lo
+    i = lo
+    gt = hi
+    while i <= gt:
+        c = char_at(A[i], d)
+        if c < pivot:
+            A[lt], A[i] = A[i], A[lt]
+            lt += 1
+            i += 1
+        elif c > pivot:
+            A[i], A[gt] = A[gt], A[i]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def string_sort(A):
+    """
+    Sorts a list of bytes (or str, compared by code point via UTF-8) in place.
+    """
+    if A and isinstance(A[0], str):
+        encoded = [s.encode('utf-8') for s in A]
+        string_sort(encoded)
+        A[:] = [s.decode('utf-8') for s in encoded]
+        return A
+
+    aux = [None] * len(A)
+    stack = [(0, len(A) - 1, 0)]  # explicit stack: depth can reach the key length
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi <= lo:
+            continue
+        if hi - lo + 1 <= CUTOFF:
+            # Three-way string quicksort
+            pivot = char_at(A[random.randint(lo, hi)], d)
+            lt, gt = dnf_partition_at(A, lo, hi, d, pivot)
+            stack.append((lo, lt - 1, d))
+            if pivot > 0:  # equal region still has bytes to compare
+                stack.append((lt, gt, d + 1))
+            stack.append((gt + 1, hi, d))
+            continue
+        starts = msd_radix_pass(A, aux, lo, hi, d)
+        for c in range(1, BASE):  # bucket 0 (keys that ended) is already in place
+            if starts[c + 1] - starts[c] > 1:
+                stack.append((lo + starts[c], lo + starts[c + 1] - 1, d + 1))
+    return A
+
+
+if __name__ == "__main__":
+    test_cases = [
+        [],
+        [b"a"],
+        [b"she", b"sells", b"seashells", b"by", b"the", b"sea", b"shore", b"", b"sea"],
+        ["naïve", "naive", "nap", "ñu", "n"],
+    ]
+    for arr in test_cases:
+        arr_copy = arr.copy()
+        string_sort(arr_copy)
+        print(f"Original: {arr}\nSorted:   {arr_copy}\n")
+
+    # URL-like keys with long shared prefixes
+    rng = random.Random(2004)
+    urls = [f"https://example.com/api/v1/users/{rng.randint(0, 10**6)}/orders/{rng.randint(0, 99)}".encode()
+            for _ in range(20_000)]
+    expected = sorted(urls)
+    string_sort(urls)
+    print("URL keys sorted OK:", urls == expected)
@@ -0,0 +1,103 @@
+# Partial sort / streaming top-k ("the k smallest") with a bounded max-heap
+# The heap holds the k smallest values seen so far with the largest at the root,
+# so each new value is compared against the root only and replaces it if smaller.
+# Time Complexity: O(n log k), vs O(n^2) for selection_sort and O(n log n) for a full sort
+# Auxiliary Space: O(1) for partial_sort (in place), O(k) for top_k
+
+import os
+import random
+import tempfile
+from itertools import islice
+
+
+def sift_down(heap, i, size, greater):
+    # Restores the max-heap property below heap[i] within heap[0:size]: O(log size)
+    while True:
+        largest = i
+        left, right = 2 * i + 1, 2 * i + 2
+        if left < size and greater(left, largest):
+            largest = left
+        if right < size and greater(right, largest):
+            largest = right
+        if largest == i:
+            return
+        heap[i], heap[largest] = heap[largest], heap[i]
+        i = largest
+
+
+def partial_sort(arr, k):
+    """
+    Rearranges arr in place so that arr[:k] holds its k smallest values in
+    ascending order; the order of arr[k:] is unspecified.
+    """
+    n = len(arr)
+    k = min(k, n)
+    if k <= 0:
+        return arr
+    greater = lambda i, j: arr[i] > arr[j]
+
+    for i in range(k // 2 - 1, -1, -1):  # heapify arr[:k]: O(k)
+        sift_down(arr, i, k, greater)
+    for i in range(k, n):  # O(n log k)
+        if arr[i] < arr[0]:
+            arr[0], arr[i] = arr[i], arr[0]
+            sift_down(arr, 0, k, greater)
+    for end in range(k - 1, 0, -1):  # heapsort arr[:k]: O(k log k)
+        arr[0], arr[end] = arr[end], arr[0]
+        sift_down(arr, 0, end, greater)
+    return arr
+
+
+def top_k(iterable, k, key=None):
+    """
+    The k smallest items of any iterable (generator, file, ...), ascending.
+
+    Consumes the input once and keeps only k items: the heap buffer holds
+    (key, arrival index, item) entries, so ties keep input order, matching
+    sorted(iterable, key=key)[:k].
+    """
+    if k <= 0:
+        return []
+    it = iter(iterable)
+    heap = [((key(x) if key else x), seq, x) for seq, x in enumerate(islice(it, k))]
+    size = len(heap)
+    greater = lambda i, j: heap[i][:2] > heap[j][:2]
+
+    for i in range(size // 2 - 1, -1, -1):  # O(k)
+        sift_down(heap, i, size, greater)
+    for seq, x in enumerate(it, start=size):  # O(n log k)
+        kx = key(x) if key else x
+        if kx < heap[0][0]:
+            heap[0] = (kx, seq, x)
+            sift_down(heap, 0, size, greater)
+    for end in range(size - 1, 0, -1):  # O(k log k)
+        heap[0], heap[end] = heap[end], heap[0]
+        sift_down(heap, 0, end, greater)
+    return [entry[2] for entry in heap]
+
+
+if __name__ == "__main__":
+    test_cases = [
+        ([], 3),
+        ([5, 4, 3, 2, 1], 2),
+        ([3, 1, 4, 1, 5, 9, 2, 6], 4),
+        ([7, 7, 7, 7], 2),
+        ([1, 2, 3], 10),
+    ]
+    for arr, k in test_cases:
+        arr_copy = arr.copy()
+        partial_sort(arr_copy, k)
+        print(f"Original: {arr}, k={k}\nSmallest: {arr_copy[:k]}  top_k: {top_k(iter(arr), k)}\n")
+
+    # Records by key from a generator: never materialised
+    rng = random.Random(2004)
+    events = ((rng.randint(0, 10**6), f"event-{i}") for i in range(100_000))
+    print("5 earliest events:", top_k(events, 5, key=lambda e: e[0]))
+
+    # File-backed iterable: one value per line
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'latencies.txt')
+        with open(path, 'w') as f:
+            f.writelines(f"{rng.random() * 100:.3f}\n" for _ in range(50_000))
+        with open(path) as f:
+            print("3 lowest latencies:", top_k(map(float, f), 3))
@@ -0,0 +1,208 @@
+# Out-of-core selection: k-th smallest value of a binary file too large for memory
+# quickselect_random needs a mutable in-memory list, so the file is only streamed:
+#   1. sampling pass: Bernoulli sample of the values (np.memmap chunks)
+#   2. counting pass: two sample values a <= b bracketing rank k split the window into
+#      < a / [a, b] / > b; only the three counts (plus a fresh sample) are kept
+#   3. once the region holding rank k fits memory_budget, an extraction pass copies just
+#      those values into a list and quickselect_random finishes
+# A miss or an oversized bracket only narrows the window and repeats step 2, so the
+# number of passes is capped by max_passes and reported in stats.
+# Time Complexity: O(n) per pass, 3 passes expected when memory_budget >= 4n / sqrt(sample_size)
+# Space Complexity: O(chunk_size + sample_size + memory_budget)
+
+import math
+import os
+import random
+import struct
+import tempfile
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # files are read with array.fromfile and scanned in Python
+    np = None
+
+from quickselect import quickselect_random
+
+SAMPLE_SIZE = 4096  # values sampled per region and pass
+
+
+def _length(source, typecode):
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source) // struct.calcsize(typecode)
+    return len(source)
+
+
+def _chunks(source, typecode, chunk_size):
+    # Yields consecutive chunks of a file path, np.memmap or in-memory buffer
+    if isinstance(source, (str, os.PathLike)):
+        if np is not None:
+            source = np.memmap(source, dtype=np.dtype(typecode), mode='r')
+        else:
+            with open(source, 'rb') as f:
+                while True:
+                    chunk = array(typecode)
+                    try:
+                        chunk.fromfile(f, chunk_size)
+                    except EOFError:  # short last chunk: what was read is kept
+                        if chunk:
+                            yield chunk
+                        return
+                    yield chunk
+    for start in range(0, len(source), chunk_size):
+        yield source[start:start + chunk_size]
+
+
+def _window(chunk, lo, hi):
+    # Values of chunk inside the window; lo / hi are None or (value, strict)
+    if np is not None and isinstance(chunk, np.ndarray):
+        mask = np.ones(len(chunk), dtype=bool)
+        if lo is not None:
+            mask &= chunk > lo[0] if lo[1] else chunk >= lo[0]
+        if hi is not None:
+            mask &= chunk < hi[0] if hi[1] else chunk <= hi[0]
+        return chunk[mask]
+    return [x for x in chunk
+            if (lo is None or (x > lo[0] if lo[1] else x >= lo[0]))
+            and (hi is None or (x < hi[0] if hi[1] else x <= hi[0]))]
+
+
+def _count_pass(chunks, lo, hi, a, b, rates, rng):
+    """
+    One streaming pass over the window (lo, hi): counts the values below a,
+    in [a, b] and above b (a / b None = unbounded), and samples each of the
+    three regions at its own rate. Returns (counts, samples).
+    """
+    counts = [0, 0, 0]
+    samples = [[], [], []]
+    for chunk in chunks:
+        w = _window(chunk, lo, hi)
+        if np is not None and isinstance(w, np.ndarray):
+            region = np.ones(len(w), dtype=np.int8)
+            if a is not None:
+                region -= w < a
+            if b is not None:
+                region += w > b
+            for r, c in enumerate(np.bincount(region, minlength=3)):
+                counts[r] += int(c)
+            keep = rng.random(len(w)) < np.asarray(rates)[region]
+            for r in range(3):
+                samples[r].extend(w[keep & (region == r)].tolist())
+        else:
+            for x in w:
+                r = 0 if a is not None and x < a else 2 if b is not None and x > b else 1
+                counts[r] += 1
+                if rng.random() < rates[r]:
+                    samples[r].append(x)
+    return counts, samples
+
+
+def _extract(chunks, lo, hi):
+    values = []
+    for chunk in chunks:
+        w = _window(chunk, lo, hi)
+        values.extend(w.tolist() if np is not None and isinstance(w, np.ndarray) else w)
+    return values
+
+
+def external_select(source, k, typecode='d', memory_budget=1 << 22, chunk_size=1 << 20,
+                    sample_size=SAMPLE_SIZE, max_passes=6, seed=None, stats=None):
+    """
+    k-th smallest value (0-indexed) of a binary file of packed numbers
+
+    Args:
+        source: Path of the file, or an np.memmap / array over it
+        k: Rank to select, 0 <= k < number of values
+        typecode: array/struct typecode of one value, e.g. 'd' or 'q'
+        memory_budget: Most values extracted into memory for the final quickselect
+        max_passes: Passes over the file allowed before giving up (RuntimeError)
+        stats: Optional dict, filled with 'passes' and the window size after each pass
+
+    Returns:
+        k-th smallest value
+    """
+    n = _length(source, typecode)
+    if not 0 <= k < n:
+        raise IndexError(f"k={k} out of range for {n} values")
+    rng = np.random.default_rng(seed) if np is not None else random.Random(seed)
+    chunks = lambda: _chunks(source, typecode, chunk_size)  # noqa: E731
+
+    lo = hi = None  # window bounds: None or (value, strict)
+    window_n = n
+    sample = []
+    windows = []  # window size after each counting pass
+    value = None
+    stalled = False  # last pass did not shrink the window (e.g. duplicates)
+    while value is None and window_n > memory_budget:
+        if len(windows) + 1 >= max_passes:  # the extraction pass still needs one
+            raise RuntimeError(f"rank window still holds {window_n} values after {len(windows)} passes")
+        # Bracket rank k with sample values ~2 standard deviations either side;
+        # after a stall, a == b is a single pivot, which always shrinks the window
+        sample.sort()
+        m = len(sample)
+        a = b = None  # with no sample yet, the pass below is the sampling pass
+        inside = window_n
+        if m:
+            target = k * m // window_n
+            gap = 0 if stalled else min(2 * math.isqrt(m) + 1, m // 4)
+            a = sample[target - gap] if target - gap >= 0 else None
+            b = sample[target + gap] if target + gap < m else None
+            inside = window_n * (min(m, target + gap + 1) - max(0, target - gap)) // m
+        rates = [min(1.0, sample_size / window_n), min(1.0, sample_size / max(1, inside)),
+                 min(1.0, sample_size / window_n)]
+        (below, inside, above), samples = _count_pass(chunks(), lo, hi, a, b, rates, rng)
+        stalled = m > 0 and inside == window_n
+
+        if k < below:  # missed low: window becomes (lo, a)
+            hi, window_n, sample = (a, True), below, samples[0]
+        elif k < below + inside:
+            if a is not None and a == b:  # rank k falls in a run of equal values
+                value = a
+            lo = (a, False) if a is not None else lo
+            hi = (b, False) if b is not None else hi
+            k, window_n, sample = k - below, inside, samples[1]
+        else:  # missed high: window becomes (b, hi)
+            lo, window_n, sample = (b, True), above, samples[2]
+            k -= below + inside
+        windows.append(window_n)
+
+    passes = len(windows)
+    if value is None:
+        value = quickselect_random(_extract(chunks(), lo, hi), k)
+        passes += 1
+    if stats is not None:
+        stats.update(passes=passes, windows=windows)
+    return value
+
+
+if __name__ == "__main__":
+    rng = random.Random(2004)
+    n = 4_000_000
+    latencies = array('d', (rng.lognormvariate(3, 1) for _ in range(n)))
+    ordered = sorted(latencies)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'latency.bin')
+        with open(path, 'wb') as f:
+            latencies.tofile(f)
+        print(f"{n} doubles ({os.path.getsize(path) >> 20} MB), memory budget 2^16 values")
+        for q in (0.5, 0.99, 0.999):
+            k = math.ceil(q * n) - 1
+            stats = {}
+            start = time.perf_counter()
+            value = external_select(path, k, memory_budget=1 << 16, stats=stats)
+            elapsed = time.perf_counter() - start
+            status = "✓" if value == ordered[k] else "✗"
+            print(f"  p{q * 100:g}: {value:.3f} in {elapsed:.2f}s, {stats['passes']} passes, "
+                  f"windows {stats['windows']} {status}")
+
+        # Few distinct values: the bracket collapses onto the answer
+        codes = array('q', (rng.randint(200, 204) for _ in range(200_000)))
+        path = os.path.join(tmp, 'codes.bin')
+        with open(path, 'wb') as f:
+            codes.tofile(f)
+        stats = {}
+        value = external_select(path, 150_000, typecode='q', memory_budget=1000, stats=stats)
+        print(f"  status codes, k=150000: {value} ({stats['passes']} passes) "
+              f"{'✓' if value == sorted(codes)[150_000] else '✗'}")
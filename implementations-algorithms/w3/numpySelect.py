@@ -0,0 +1,133 @@
+# Vectorized selection for large NumPy arrays (10^8 floats)
+# Same contract as quickselect_random(A, k, lo, hi): returns the k-th smallest of A[lo..hi].
+# Instead of swapping one element at a time (dnf_partition), each round:
+#   1. samples the candidates and picks two pivots that bracket rank k in the sample
+#   2. counts < / <= pivot with vectorized comparisons (the DNF regions, as counts)
+#   3. compresses the candidates to the region that holds rank k (np.compress)
+# Once the candidates fit SMALL, np.partition finishes the job.
+# Time Complexity: O(n) expected (the candidate set shrinks by ~sqrt(sample) per round)
+# Space Complexity: O(n) for the first compressed candidate set; A is not modified
+
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # quickselect_numpy falls back to quickselect_random on a list copy
+    np = None
+
+from quickselect import quickselect_random
+
+SMALL = 4096  # candidates at or below this are finished with np.partition
+SAMPLE = 1024  # pivot sample size per round
+
+
+def _nan_filter(values, k, nan_policy):
+    # Applies the NaN policy; returns (values, k) or raises
+    nans = np.isnan(values)
+    count = int(nans.sum())
+    if not count:
+        return values, k
+    if nan_policy == 'raise':
+        raise ValueError(f"input contains {count} NaN values")
+    if nan_policy == 'omit':
+        values = values[~nans]
+        if k >= len(values):
+            raise IndexError(f"k={k} out of range for {len(values)} non-NaN values")
+        return values, k
+    if nan_policy == 'last':  # NaNs rank above every number, as in np.sort
+        if k >= len(values) - count:
+            return np.array([np.nan], dtype=values.dtype), 0
+        return values[~nans], k
+    raise ValueError(f"unknown nan_policy {nan_policy!r}")
+
+
+def quickselect_numpy(A, k, lo=0, hi=None, nan_policy='raise', seed=None):
+    """
+    k-th smallest element (0-indexed) of A[lo..hi] for a 1-D ndarray
+
+    Args:
+        A: np.ndarray of ints or floats (not modified)
+        k: Index of desired order statistic within A (0-indexed, lo <= k <= hi)
+        nan_policy: float inputs only - 'raise' (default), 'omit' (k ranks the
+                    non-NaN values) or 'last' (NaNs rank after all numbers)
+
+    Returns:
+        k-th smallest element, as a scalar of A's dtype
+    """
+    if hi is None:
+        hi = len(A) - 1
+    if not lo <= k <= hi:
+        raise IndexError(f"k={k} outside [{lo}, {hi}]")
+    if np is None:
+        return quickselect_random(list(A[lo:hi + 1]), k - lo)
+    cand = np.asarray(A)[lo:hi + 1]
+    k -= lo
+    if cand.dtype.kind == 'f':
+        cand, k = _nan_filter(cand, k, nan_policy)
+    elif cand.dtype.kind not in 'iub':
+        raise TypeError(f"unsupported dtype {cand.dtype}")
+
+    rng = np.random.default_rng(seed)
+    while len(cand) > SMALL:
+        n = len(cand)
+        # Two pivots bracketing rank k in the sample, ~sqrt(SAMPLE) sample ranks apart
+        sample = np.sort(cand[rng.integers(0, n, SAMPLE)])
+        centre = k * SAMPLE // n
+        gap = int(np.sqrt(SAMPLE))
+        p_lo = sample[max(0, centre - gap)]
+        p_hi = sample[min(SAMPLE - 1, centre + gap)]
+
+        below = cand < p_lo
+        n_less = int(np.count_nonzero(below))
+        not_above = cand <= p_hi
+        n_le = int(np.count_nonzero(not_above))
+
+        if k < n_less:
+            cand = np.compress(below, cand)
+        elif k >= n_le:
+            cand = np.compress(~not_above, cand)
+            k -= n_le
+        else:
+            if p_lo == p_hi:  # rank k is inside a block of equal values
+                return cand.dtype.type(p_lo)
+            if n_less == 0 and n_le == n:  # pivots bracket everything: no progress
+                break
+            cand = np.compress(not_above & ~below, cand)
+            k -= n_less
+    return np.partition(cand, k)[k]
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(2004)
+
+    # Contract check against quickselect_random
+    for dtype in (np.int32, np.int64, np.float32, np.float64):
+        A = (rng.standard_normal(50_000) * 1000).astype(dtype)
+        ks = [0, 1, 12_345, 25_000, 49_999]
+        ok = all(quickselect_numpy(A, k) == quickselect_random(A.tolist(), k) for k in ks)
+        result = quickselect_numpy(A, 25_000)
+        print(f"{np.dtype(dtype).name:<8} result dtype {result.dtype}, matches quickselect_random: {ok}")
+
+    # NaN policies
+    B = np.array([3.0, np.nan, 1.0, 2.0, np.nan])
+    print("omit, k=2:", quickselect_numpy(B, 2, nan_policy='omit'))
+    print("last, k=4:", quickselect_numpy(B, 4, nan_policy='last'))
+    try:
+        quickselect_numpy(B, 0)
+    except ValueError as e:
+        print("raise:", e)
+
+    # Speed: 10^6 floats
+    n = 10**6
+    C = rng.random(n)
+    start = time.perf_counter()
+    fast = quickselect_numpy(C, n // 2)
+    t_numpy = time.perf_counter() - start
+    lst = C.tolist()
+    start = time.perf_counter()
+    random.seed(1)
+    slow = quickselect_random(lst, n // 2)
+    t_python = time.perf_counter() - start
+    print(f"n=10^6 median: quickselect_numpy {t_numpy * 1000:.1f} ms, "
+          f"quickselect_random {t_python * 1000:.0f} ms, equal: {fast == slow}")
@@ -0,0 +1,214 @@
+# Distributed k-th order statistic over arrays sharded in multiprocessing.shared_memory
+# Each round is one dnf_partition done as counts: the coordinator picks a pivot, every
+# worker counts the less / equal / greater elements of its shard that are still in the
+# candidate window (lo_bound, hi_bound), and the coordinator keeps the region holding
+# rank k. Workers also send back a few random values from the < and > regions, which the
+# coordinator uses (weighted by the counts) to aim the next pivot at rank k.
+# Once the window holds at most LOCAL_LIMIT values, one worker gathers them and finishes
+# with quickselect_random. Only names, bounds, pivots, counts and samples cross process
+# boundaries, never the shards themselves.
+# Time Complexity: O(n / P) per round, O(log n / log(P * SAMPLE)) rounds expected
+# Auxiliary Space: O(n / P) per worker (its window), O(P * SAMPLE) in the coordinator
+
+import random
+import time
+from array import array
+from multiprocessing import Pool, shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # workers fall back to Python loops over memoryviews
+    np = None
+
+from quickselect import quickselect_random
+
+SAMPLE = 64  # values each worker returns per region and round
+LOCAL_LIMIT = 1 << 16  # window size a single worker finishes on its own
+
+# Set in each worker by _attach: one typed view per shard
+_views = None
+_blocks = None
+
+
+def _attach(names, lengths, typecode):
+    global _views, _blocks
+    _blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    if np is not None:
+        _views = [np.frombuffer(block.buf, dtype=typecode, count=n) for block, n in zip(_blocks, lengths)]
+    else:
+        _views = [block.buf.cast('B').cast(typecode)[:n] for block, n in zip(_blocks, lengths)]
+
+
+def _in_window(view, lo_bound, hi_bound):
+    # Values of view strictly between the bounds (None = unbounded), as a local copy
+    if np is not None:
+        mask = np.ones(len(view), dtype=bool)
+        if lo_bound is not None:
+            mask &= view > lo_bound
+        if hi_bound is not None:
+            mask &= view < hi_bound
+        return view[mask]
+    return [x for x in view
+            if (lo_bound is None or x > lo_bound) and (hi_bound is None or x < hi_bound)]
+
+
+def _sample(values, size, rng):
+    if len(values) <= size:
+        return list(values.tolist() if np is not None else values)
+    picks = [values[rng.randrange(len(values))] for _ in range(size)]
+    return [x.item() for x in picks] if np is not None else picks
+
+
+def _count(task):
+    # (less, equal, greater, sample of less, sample of greater) for one shard's window;
+    # without a pivot the whole window is reported as "less"
+    shard, lo_bound, hi_bound, pivot, sample_size, seed = task
+    rng = random.Random(seed)
+    values = _in_window(_views[shard], lo_bound, hi_bound)
+    if pivot is None:
+        return len(values), 0, 0, _sample(values, sample_size, rng), []
+    if np is not None:
+        less, greater = values[values < pivot], values[values > pivot]
+    else:
+        less = [x for x in values if x < pivot]
+        greater = [x for x in values if x > pivot]
+    equal = len(values) - len(less) - len(greater)
+    return (len(less), equal, len(greater),
+            _sample(less, sample_size, rng), _sample(greater, sample_size, rng))
+
+
+def _finish(task):
+    # Gathers the (small) window from every shard and selects rank k in it
+    lo_bound, hi_bound, k = task
+    values = []
+    for view in _views:
+        window = _in_window(view, lo_bound, hi_bound)
+        values.extend(window.tolist() if np is not None else window)
+    return quickselect_random(values, k)
+
+
+def pick_pivot(samples, counts, k):
+    """
+    Sample value whose weighted rank is closest to k, where each of shard i's
+    sampled values stands for counts[i] / len(samples[i]) window elements.
+    """
+    weighted = sorted((x, counts[i] / len(sample))
+                      for i, sample in enumerate(samples) if sample for x in sample)
+    seen = 0.0
+    for x, weight in weighted:
+        seen += weight
+        if seen > k:
+            return x
+    return weighted[-1][0]
+
+
+def make_shards(values, shards, typecode='d'):
+    """
+    Copies values into `shards` contiguous shared-memory blocks.
+
+    :return: (blocks, specs), specs being the [(name, length)] list that
+             parallel_select takes; the caller closes and unlinks the blocks
+    """
+    data = array(typecode, values)
+    bounds = [len(data) * s // shards for s in range(shards + 1)]
+    blocks, specs = [], []
+    for lo, hi in zip(bounds, bounds[1:]):
+        block = shared_memory.SharedMemory(create=True, size=max(1, (hi - lo) * data.itemsize))
+        view = block.buf.cast('B').cast(typecode)
+        view[:hi - lo] = data[lo:hi]
+        view.release()
+        blocks.append(block)
+        specs.append((block.name, hi - lo))
+    return blocks, specs
+
+
+def parallel_select(shards, k, typecode='d', workers=None, sample_size=SAMPLE, stats=None):
+    """
+    k-th smallest element (0-indexed) of the concatenation of the shards
+
+    Args:
+        shards: [(shared memory name, number of elements)] per shard
+        k: Rank to select, 0 <= k < total length
+        typecode: array typecode of the shard elements ('d', 'q', ...)
+        workers: Number of worker processes (default: one per shard)
+        stats: Optional dict, filled with 'rounds' and the window size per round
+
+    Returns:
+        k-th smallest element
+    """
+    names = [name for name, _ in shards]
+    lengths = [length for _, length in shards]
+    n = sum(lengths)
+    if not 0 <= k < n:
+        raise IndexError(f"k={k} out of range for {n} elements")
+
+    lo_bound = hi_bound = None
+    windows = []
+    with Pool(workers or len(shards), initializer=_attach,
+              initargs=(names, lengths, typecode)) as pool:
+        def count_round(pivot, round_no):
+            tasks = [(s, lo_bound, hi_bound, pivot, sample_size, round_no * len(shards) + s)
+                     for s in range(len(shards))]
+            return pool.map(_count, tasks)
+
+        results = count_round(None, 0)
+        counts = [r[0] for r in results]
+        samples = [r[3] for r in results]
+        value = None
+        while value is None:
+            windows.append(sum(counts))
+            if windows[-1] <= LOCAL_LIMIT:
+                value = pool.apply(_finish, ((lo_bound, hi_bound, k),))
+                break
+            pivot = pick_pivot(samples, counts, k)
+            results = count_round(pivot, len(windows))
+            less = sum(r[0] for r in results)
+            equal = sum(r[1] for r in results)
+            if k < less:  # rank k is in the < region
+                hi_bound = pivot
+                counts = [r[0] for r in results]
+                samples = [r[3] for r in results]
+            elif k < less + equal:  # rank k is the pivot
+                value = pivot
+            else:  # rank k is in the > region
+                k -= less + equal
+                lo_bound = pivot
+                counts = [r[2] for r in results]
+                samples = [r[4] for r in results]
+
+    if stats is not None:
+        stats.update(rounds=len(windows), windows=windows)
+    return value
+
+
+if __name__ == "__main__":
+    rng = random.Random(2004)
+    n = 1_000_000
+    data = [rng.gauss(0, 1) for _ in range(n)]
+    blocks, specs = make_shards(data, shards=4)
+    try:
+        for q in (0.5, 0.99, 0.999):
+            k = int(q * (n - 1))
+            stats = {}
+            start = time.perf_counter()
+            value = parallel_select(specs, k, stats=stats)
+            elapsed = time.perf_counter() - start
+            expected = quickselect_random(data.copy(), k)
+            status = "✓" if value == expected else "✗"
+            print(f"k={k}: {value:.6f} in {elapsed:.2f}s, {stats['rounds']} rounds, "
+                  f"windows {stats['windows']} {status}")
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    # Integer shards with many duplicates: the pivot itself is often the answer
+    ints = [rng.randint(0, 50) for _ in range(200_000)]
+    blocks, specs = make_shards(ints, shards=3, typecode='q')
+    try:
+        ok = all(parallel_select(specs, k, typecode='q') == sorted(ints)[k] for k in (0, 100_000, 199_999))
+        print("Integer shards with duplicates:", "✓" if ok else "✗")
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
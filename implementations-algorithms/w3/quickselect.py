@@ -3,7 +3,9 @@
 # Space Complexity: O(log n) average case for recursion stack, O(n) worst case
 # Based on FIT2004 Course Notes Chapter 4 and Lecture 3
 
+import math
 import random
+from bisect import bisect_left, bisect_right
 
 
 def hoare_partition(A, lo, hi):
@@ -132,40 +134,67 @@ def quickselect_random(A, k, lo=0, hi=None):
             return A[k]
 
 
+# Optimal 9-comparator sorting network for 5 elements (compare-exchange pairs)
+SORT5_NETWORK = ((0, 1), (3, 4), (2, 4), (2, 3), (0, 3), (0, 2), (1, 4), (1, 3), (1, 2))
+
+
+def sort_group(A, lo, size):
+    """
+    Sorts A[lo..lo+size-1] (size <= 5) in place with a fixed comparison network
+
+    Time Complexity: O(1) - at most 9 compare-exchanges
+    Space Complexity: O(1)
+    """
+    if size == 5:
+        for i, j in SORT5_NETWORK:
+            if A[lo + j] < A[lo + i]:
+                A[lo + i], A[lo + j] = A[lo + j], A[lo + i]
+        return
+    for i in range(lo + 1, lo + size):  # short last group: insertion sort
+        j = i
+        while j > lo and A[j] < A[j - 1]:
+            A[j], A[j - 1] = A[j - 1], A[j]
+            j -= 1
+
+
 def median_of_medians(A, lo, hi):
     """
-    Median of Medians - finds approximate median in O(n)
+    Median of Medians - finds a pivot value in O(n), in place
 
     Algorithm:
-    1. Divide array into groups of 5
-    2. Find median of each group
-    3. Recursively find median of these medians
+    1. Sort each group of 5 in A[lo..hi] with a fixed comparison network
+    2. Swap each group's median to the front: A[lo], A[lo+1], ...
+    3. Select the true median of those medians with quickselect_mom
+       (which recursively uses this function)
 
     Guarantees pivot quality: between 30th and 70th percentile
 
     Time Complexity: O(n)
     Recurrence: T(n) = T(n/5) + T(7n/10) + O(n) = O(n)
 
-    Space Complexity: O(n) for medians array
+    Space Complexity: O(log n) recursion, no auxiliary lists
+    Note: reorders A[lo..hi] (QuickSelect partitions it next anyway)
     """
     n = hi - lo + 1
 
-    # Base case: sort small groups directly
+    # Base case: sort the single group directly
     if n <= 5:
-        sorted_group = sorted(A[lo:hi+1])
-        return sorted_group[n // 2]
+        sort_group(A, lo, n)
+        return A[lo + (n - 1) // 2]
 
-    # Divide into groups of 5 and find medians
-    medians = []
+    # Sort groups of 5 and move their medians to A[lo..lo+groups-1]
+    groups = 0
     i = lo
     while i <= hi:
-        group_end = min(i + 4, hi)
-        group = sorted(A[i:group_end+1])
-        medians.append(group[len(group) // 2])
+        size = min(5, hi - i + 1)
+        sort_group(A, i, size)
+        median_idx = i + (size - 1) // 2
+        A[lo + groups], A[median_idx] = A[median_idx], A[lo + groups]
+        groups += 1
         i += 5
 
-    # Recursively find median of medians
-    return median_of_medians(medians, 0, len(medians) - 1)
+    # True selection of the median of the medians
+    return quickselect_mom(A, lo + (groups - 1) // 2, lo, lo + groups - 1)
 
 
 def quickselect_mom(A, k, lo=0, hi=None):
@@ -177,7 +206,7 @@ def quickselect_mom(A, k, lo=0, hi=None):
     balanced partition (at most 70% of elements on one side)
 
     Time Complexity: O(n) worst-case
-    Space Complexity: O(n) for median-of-medians computation
+    Space Complexity: O(log n) for the median-of-medians recursion
 
     Note: Slower in practice than random pivot due to constant factors
     """
@@ -204,15 +233,278 @@ def quickselect_mom(A, k, lo=0, hi=None):
             return A[k]
 
 
-def find_median(A):
+def median_of_3(a, b, c):
+    """Median of three values using at most 3 comparisons"""
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+
+def ninther_pivot(A, lo, hi):
     """
-    Finds median of array A using QuickSelect
+    Cheap pivot for introselect
+
+    Median of first/middle/last for small ranges; for 40+ elements, Tukey's
+    ninther: the median of the medians of three evenly spaced triples.
+
+    Time Complexity: O(1)
+    """
+    mid = (lo + hi) // 2
+    if hi - lo + 1 < 40:
+        return median_of_3(A[lo], A[mid], A[hi])
+    step = (hi - lo + 1) // 8
+    return median_of_3(
+        median_of_3(A[lo], A[lo + step], A[lo + 2 * step]),
+        median_of_3(A[mid - step], A[mid], A[mid + step]),
+        median_of_3(A[hi - 2 * step], A[hi - step], A[hi]),
+    )
+
+
+def introselect(A, k, lo=0, hi=None):
+    """
+    Introselect - QuickSelect with a Median-of-Medians safety net
+
+    Algorithm:
+    1. Partition with a cheap pivot (median-of-3 / ninther) and DNF partition
+    2. Every 2 partitions, check the range has at least halved
+    3. If it has not, the pivots are being defeated (unlucky or adversarial
+       input): finish the range with quickselect_mom
+
+    Time Complexity:
+    - Average case: O(n), with random-pivot constant factors
+    - Worst case: O(n) - at most O(n) work is done before the switch
+      (the range halves every 2 rounds), then median-of-medians is O(n)
+
+    Space Complexity: O(1) extra besides quickselect_mom
+    """
+    if hi is None:
+        hi = len(A) - 1
+
+    rounds = 0
+    checkpoint = hi - lo + 1  # range size 2 rounds ago
+    while True:
+        if lo == hi:
+            return A[lo]
+
+        pivot_val = ninther_pivot(A, lo, hi)
+        lt, gt = dnf_partition(A, lo, hi, pivot_val)
+
+        if k < lt:
+            hi = lt - 1
+        elif k > gt:
+            lo = gt + 1
+        else:
+            return A[k]
+
+        rounds += 1
+        if rounds % 2 == 0:
+            size = hi - lo + 1
+            if size > checkpoint // 2:  # not shrinking geometrically
+                return quickselect_mom(A, k, lo, hi)
+            checkpoint = size
+
+
+FR_CUTOFF = 600  # ranges this small are finished by quickselect_random
+
+
+def floyd_rivest(A, k, lo=0, hi=None):
+    """
+    Floyd-Rivest selection - two sampled pivots that bracket k tightly
+
+    Algorithm:
+    1. Move a random sample of s ~ n^(2/3) elements to the front of the range
+    2. Recursively select two sample elements u <= v just below and above
+       k's expected position in the sample (about sqrt(s log n) / 2 ranks
+       each side, so k falls between them with high probability)
+    3. DNF-partition the range around the pivot on the larger side of k first
+       (v if k is in the lower half, u otherwise), then the remaining side
+       around the other pivot
+    4. Continue in the region holding k, usually the small [u, v] band
+
+    Most elements are partitioned only once, against the pivot far from k:
+    about 1.2n comparisons for high ranks such as p99.9 and 2.5n for the
+    median, against 3.5n-4n for quickselect_random (see benchmark()). Low ranks
+    cost ~2n, as dnf_partition compares elements above the pivot twice.
 
     Time Complexity: O(n) average case
+    Space Complexity: O(log log n) recursion on the samples
+
+    Args:
+        A: List of comparable elements (modified in-place)
+        k: Index of desired order statistic (0-indexed)
+        lo: Start of range (default 0)
+        hi: End of range (default len(A)-1)
+
+    Returns:
+        k-th smallest element
+    """
+    if hi is None:
+        hi = len(A) - 1
+
+    while hi - lo + 1 > FR_CUTOFF:
+        n = hi - lo + 1
+        z = math.log(n)
+        s = int(math.exp(2 * z / 3))
+        gap = int(math.sqrt(z * s) / 2) + 1
+
+        # Random sample in A[lo..lo+s-1]
+        for j in range(lo, lo + s):
+            r = random.randint(j, hi)
+            A[j], A[r] = A[r], A[j]
+        target = lo + (k - lo) * s // n
+        u_rank = max(lo, target - gap)
+        v_rank = min(lo + s - 1, target + gap)
+        u = floyd_rivest(A, u_rank, lo, lo + s - 1)
+        v = floyd_rivest(A, v_rank, u_rank, lo + s - 1)  # sample is split at u_rank
+
+        if 2 * (k - lo) < n:
+            # Split off the (large) > v region, then the < u region
+            lt, gt = dnf_partition(A, lo, hi, v)
+            if k > gt:
+                lo = gt + 1
+                continue
+            if k >= lt:
+                return v
+            hi = lt - 1
+            lt, gt = dnf_partition(A, lo, hi, u)
+        else:
+            # Split off the (large) < u region, then the > v region
+            lt, gt = dnf_partition(A, lo, hi, u)
+            if k < lt:
+                hi = lt - 1
+                continue
+            if k <= gt:
+                return u
+            lo = gt + 1
+            lt, gt = dnf_partition(A, lo, hi, v)
+
+        if k < lt:
+            hi = lt - 1
+        elif k > gt:
+            lo = gt + 1
+        else:
+            return A[k]
+
+    return quickselect_random(A, k, lo, hi)
+
+
+def benchmark(n=100_000, qs=(0.001, 0.5, 0.999), trials=3):
+    """
+    Prints the average comparisons per element of each selection engine for
+    the nearest-rank quantiles qs of n random floats.
+    """
+    class Counted:
+        # Float wrapper that counts the comparisons made on it
+        __slots__ = ('value',)
+        comparisons = 0
+
+        def __init__(self, value):
+            self.value = value
+
+        def __lt__(self, other):
+            Counted.comparisons += 1
+            return self.value < other.value
+
+        def __gt__(self, other):
+            Counted.comparisons += 1
+            return self.value > other.value
+
+    engines = [quickselect_random, quickselect_mom, introselect, floyd_rivest]
+    print(f"Comparisons per element, n={n}, average of {trials} runs")
+    print(f"{'quantile':<10}" + "".join(f"{engine.__name__:>20}" for engine in engines))
+    for q in qs:
+        k = max(0, math.ceil(q * n) - 1)
+        row = []
+        for engine in engines:
+            total = 0
+            for _ in range(trials):
+                A = [Counted(random.random()) for _ in range(n)]
+                Counted.comparisons = 0
+                engine(A, k)
+                total += Counted.comparisons
+            row.append(total / trials / n)
+        print(f"{q:<10g}" + "".join(f"{c:>20.2f}" for c in row))
+
+
+def find_median(A, select=introselect):
+    """
+    Finds median of array A using QuickSelect
+
+    Args:
+        select: selection engine with the quickselect_random(A, k) contract
+                (default introselect)
+
+    Time Complexity: O(n) average case, O(n) worst case with introselect
     """
     n = len(A)
     k = (n - 1) // 2 if n % 2 == 1 else n // 2
-    return quickselect_random(A.copy(), k)
+    return select(A.copy(), k)
+
+
+def multiselect(A, ks):
+    """
+    Multiselect - finds several order statistics in one partitioning pass
+
+    Algorithm:
+    1. Partition A[lo..hi] once around a random pivot (DNF partition)
+    2. Every requested rank in the equal region is answered by the pivot
+    3. Recurse only into the sides that still contain requested ranks
+
+    Each level of recursion partitions disjoint ranges, so q ranks cost
+    O(n log q) in total instead of q separate O(n) selections.
+
+    Time Complexity: O(n log q) average case, O(n²) worst case
+    Space Complexity: O(q) for the work stack
+
+    Args:
+        A: List of comparable elements (modified in-place)
+        ks: Iterable of desired ranks (0-indexed)
+
+    Returns:
+        Dict mapping each rank in ks to the k-th smallest element
+    """
+    ranks = sorted(set(ks))
+    result = {}
+    stack = [(0, len(A) - 1, ranks)] if ranks else []
+
+    while stack:
+        lo, hi, pending = stack.pop()
+        if lo == hi:
+            result[lo] = A[lo]
+            continue
+
+        pivot_val = A[random.randint(lo, hi)]
+        lt, gt = dnf_partition(A, lo, hi, pivot_val)
+
+        # Split the sorted ranks into < lt, [lt, gt] and > gt
+        first_eq = bisect_left(pending, lt)
+        first_gt = bisect_right(pending, gt)
+        for k in pending[first_eq:first_gt]:
+            result[k] = pivot_val
+        if first_eq > 0:
+            stack.append((lo, lt - 1, pending[:first_eq]))
+        if first_gt < len(pending):
+            stack.append((gt + 1, hi, pending[first_gt:]))
+
+    return result
+
+
+def quantiles(A, qs):
+    """
+    Quantiles of A (nearest-rank: the ceil(q*n)-th smallest) via one multiselect
+
+    Example: quantiles(latencies, [0.5, 0.9, 0.99]) -> {0.5: p50, 0.9: p90, 0.99: p99}
+
+    Time Complexity: O(n log q) average case
+    """
+    n = len(A)
+    rank_of = {q: min(n - 1, max(0, math.ceil(q * n) - 1)) for q in qs}
+    values = multiselect(A.copy(), rank_of.values())
+    return {q: values[k] for q, k in rank_of.items()}
 
 
 if __name__ == "__main__":
@@ -292,7 +584,44 @@ if __name__ == "__main__":
     result = quickselect_random(F.copy(), 2)
     print(f"Reverse sorted [5,4,3,2,1], k=2: {result} {'✓' if result == 3 else '✗'}")
 
-    # Test 5: Performance comparison (conceptual)
+    # Test 5: Several order statistics in one pass
+    print("\n" + "="*70)
+    print("Test 5: Multiselect and Quantiles")
+    print("-" * 70)
+    G = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+    ranks = [0, 4, 5, 9]
+    result = multiselect(G.copy(), ranks)
+    expected = {k: sorted(G)[k] for k in ranks}
+    print(f"Array: {G}, ranks {ranks}: {result} {'✓' if result == expected else '✗'}")
+    latencies = [random.expovariate(1 / 20) for _ in range(10_000)]
+    q = quantiles(latencies, [0.5, 0.9, 0.99])
+    print("Latency p50/p90/p99: " + ", ".join(f"{v:.1f}" for v in q.values()))
+
+    # Test 6: Introselect on inputs that defeat median-of-3 pivots
+    print("\n" + "="*70)
+    print("Test 6: Introselect")
+    print("-" * 70)
+    for k in [0, 3, 5, 7]:
+        result = introselect(B.copy(), k)
+        expected = sorted(B)[k]
+        status = "✓" if result == expected else "✗"
+        print(f"  k={k}: introselect={result}, expected={expected} {status}")
+    # Organ pipe with a spike: median-of-3 repeatedly picks near-extreme pivots
+    H = list(range(0, 4000, 2)) + list(range(3999, 0, -2))
+    result = introselect(H.copy(), len(H) // 2)
+    print(f"Organ pipe n={len(H)}, median: {result} {'✓' if result == sorted(H)[len(H) // 2] else '✗'}")
+
+    # Test 7: Floyd-Rivest, and comparison counts of every engine
+    print("\n" + "="*70)
+    print("Test 7: Floyd-Rivest")
+    print("-" * 70)
+    J = [random.random() for _ in range(20_000)]
+    ok = all(floyd_rivest(J.copy(), k) == sorted(J)[k] for k in [0, 19, 10_000, 19_979, 19_999])
+    print(f"n={len(J)}, k in [0, 19, 10000, 19979, 19999]: {'✓' if ok else '✗'}")
+    print(f"find_median(A, select=floyd_rivest): {find_median(A, select=floyd_rivest)}")
+    benchmark(n=50_000)
+
+    # Test 8: Performance comparison (conceptual)
     print("\n" + "="*70)
     print("ALGORITHM COMPARISON")
     print("="*70)
@@ -308,6 +637,16 @@ if __name__ == "__main__":
     print("  - Slower in practice")
     print("  - Theoretical importance: proves O(n) selection possible")
     print()
+    print("Introselect (default for find_median):")
+    print("  - Worst case: O(n) guaranteed")
+    print("  - Ninther pivots: random-pivot speed in practice")
+    print("  - Falls back to median-of-medians only if ranges stop halving")
+    print()
+    print("Floyd-Rivest:")
+    print("  - Average case: O(n), fewest comparisons")
+    print("  - Sampled pivots bracket k, so most elements are partitioned once")
+    print("  - Best for ranks far from the median (p99, p99.9)")
+    print()
     print("Sorting then selecting:")
     print("  - O(n log n) - always slower than selection for single query")
     print("="*70)
\ No newline at end of file
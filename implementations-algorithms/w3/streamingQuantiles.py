@@ -0,0 +1,220 @@
+# Streaming median and quantiles, for metric streams too long to re-select from scratch
+# RunningMedian: exact median in O(log n) per sample with two heaps (lower half in a
+#   max-heap, upper half in a min-heap); sliding windows delete lazily and rebuild
+#   the heaps once stale entries outnumber live ones, so memory stays O(window).
+# QuantileSketch: approximate quantiles in bounded memory (KLL-style compactors, the
+#   mergeable relative of GK), so per-core sketches can be combined.
+# Both are checked against quickselect_random on snapshots in the demo below.
+
+import heapq
+import math
+import random
+from collections import deque
+
+from quickselect import quickselect_random
+
+
+class RunningMedian:
+    """
+    Exact running median of numbers, matching find_median's choice of rank
+    ((n-1)//2 for odd n, n//2 for even n).
+
+    low holds the smaller half as a max-heap (values negated), high the larger
+    half as a min-heap, with len(low) == len(high) or len(high) + 1. Removed
+    values are only counted in `delayed` and discarded when they reach a heap
+    top; when pending deletions outnumber the live values, both heaps are
+    rebuilt from the window.
+
+    Time Complexity: O(log n) amortised per add/remove, O(1) per median
+    Space Complexity: O(n) without a window, O(window) with one
+    """
+
+    def __init__(self, window=None):
+        self.low, self.high = [], []
+        self.low_size = self.high_size = 0  # live elements, excluding delayed ones
+        self.delayed = {}  # value -> pending deletions, zero counts removed
+        self.pending = 0  # total pending deletions
+        self.window = deque() if window else None
+        self.maxlen = window
+
+    def __len__(self):
+        return self.low_size + self.high_size
+
+    def _prune(self, heap, sign):
+        # Pops lazily-deleted values off the top of heap
+        while heap and self.delayed.get(sign * heap[0]):
+            x = sign * heapq.heappop(heap)
+            self.delayed[x] -= 1
+            if not self.delayed[x]:
+                del self.delayed[x]
+            self.pending -= 1
+
+    def _rebuild(self):
+        # Drops every stale entry: re-splits the window's values into the two heaps, O(w)
+        values = sorted(self.window)
+        half = (len(values) + 1) // 2
+        self.low = [-x for x in values[:half]]
+        self.high = values[half:]
+        heapq.heapify(self.low)
+        heapq.heapify(self.high)
+        self.low_size, self.high_size = len(self.low), len(self.high)
+        self.delayed.clear()
+        self.pending = 0
+
+    def _rebalance(self):
+        if self.low_size > self.high_size + 1:
+            heapq.heappush(self.high, -heapq.heappop(self.low))
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune(self.low, -1)
+        elif self.low_size < self.high_size:
+            heapq.heappush(self.low, -heapq.heappop(self.high))
+            self.high_size -= 1
+            self.low_size += 1
+            self._prune(self.high, 1)
+
+    def add(self, x):
+        if self.window is not None:
+            if len(self.window) == self.maxlen:
+                self.remove(self.window.popleft())
+            self.window.append(x)
+        if not self.low or x <= -self.low[0]:
+            heapq.heappush(self.low, -x)
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, x)
+            self.high_size += 1
+        self._rebalance()
+
+    def remove(self, x):
+        # x must currently be in the structure
+        self.delayed[x] = self.delayed.get(x, 0) + 1
+        self.pending += 1
+        if x <= -self.low[0]:
+            self.low_size -= 1
+            if x == -self.low[0]:
+                self._prune(self.low, -1)
+        else:
+            self.high_size -= 1
+            if self.high and x == self.high[0]:
+                self._prune(self.high, 1)
+        self._rebalance()
+        if self.window is not None and self.pending > len(self):
+            self._rebuild()
+
+    def median(self):
+        if not len(self):
+            raise ValueError("median of an empty stream")
+        if len(self) % 2:
+            return -self.low[0]
+        return self.high[0]
+
+
+class QuantileSketch:
+    """
+    Mergeable approximate quantile sketch (KLL-style compactors).
+
+    Level h stores values that each stand for 2^h samples. When a level fills,
+    it is sorted and every other value (random offset) is promoted to level
+    h + 1, halving its size while keeping ranks unbiased. Capacities shrink
+    geometrically for lower levels, so memory stays O(k) words.
+
+    Rank error: about n / k with high probability.
+    Time Complexity: O(log k) amortised per add, O(k log k) per query
+    """
+
+    def __init__(self, k=200, seed=None):
+        self.k = k
+        self.levels = [[]]
+        self.n = 0
+        self.rng = random.Random(seed)
+
+    def _capacity(self, h):
+        depth = len(self.levels) - h - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) >= self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append([])
+                level.sort()
+                keep = [level.pop()] if len(level) % 2 else []  # odd one out stays
+                self.levels[h + 1].extend(level[self.rng.randint(0, 1)::2])
+                self.levels[h] = keep
+            h += 1
+
+    def add(self, x):
+        self.levels[0].append(x)
+        self.n += 1
+        if len(self.levels[0]) >= self._capacity(0):
+            self._compress()
+
+    def merge(self, other):
+        """Absorbs another sketch (e.g. from another core); other is unchanged."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for h, level in enumerate(other.levels):
+            self.levels[h].extend(level)
+        self.n += other.n
+        self._compress()
+        return self
+
+    def _weighted(self):
+        return sorted((x, 1 << h) for h, level in enumerate(self.levels) for x in level)
+
+    def quantile(self, q):
+        """Approximate nearest-rank quantile (the ceil(q*n)-th smallest sample)."""
+        if not self.n:
+            raise ValueError("quantile of an empty sketch")
+        target = max(1, math.ceil(q * self.n))
+        seen = 0
+        items = self._weighted()
+        for x, weight in items:
+            seen += weight
+            if seen >= target:
+                return x
+        return items[-1][0]
+
+    def __len__(self):
+        return self.n
+
+    def size(self):
+        # Number of stored values (memory footprint)
+        return sum(len(level) for level in self.levels)
+
+
+if __name__ == "__main__":
+    rng = random.Random(2004)
+    stream = [rng.gauss(100, 15) for _ in range(20_000)]
+
+    # Exact running median, whole stream and a sliding window of 500
+    running, windowed = RunningMedian(), RunningMedian(window=500)
+    ok = True
+    for i, x in enumerate(stream, start=1):
+        running.add(x)
+        windowed.add(x)
+        if i % 2_500 == 0:  # snapshot check against quickselect_random
+            prefix, window = stream[:i], stream[max(0, i - 500):i]
+            ok &= running.median() == quickselect_random(prefix.copy(), len(prefix) // 2)
+            ok &= windowed.median() == quickselect_random(window.copy(), len(window) // 2)
+    print(f"Running median {running.median():.2f}, window median {windowed.median():.2f}, "
+          f"snapshots match quickselect_random: {ok}")
+
+    # Four per-core sketches merged into one
+    sketches = [QuantileSketch(k=200, seed=c) for c in range(4)]
+    for i, x in enumerate(stream):
+        sketches[i % 4].add(x)
+    merged = sketches[0]
+    for other in sketches[1:]:
+        merged.merge(other)
+    n = len(stream)
+    print(f"Merged sketch: {len(merged)} samples in {merged.size()} stored values")
+    for q in (0.5, 0.9, 0.99, 0.999):
+        estimate = merged.quantile(q)
+        k = max(0, math.ceil(q * n) - 1)
+        exact = quickselect_random(stream.copy(), k)
+        rank = sum(1 for x in stream if x <= estimate) - 1
+        print(f"  p{q * 100:g}: sketch {estimate:.2f}, exact {exact:.2f}, rank error {abs(rank - k) / n:.4f}")